@@ -63,9 +63,27 @@ def get_excel_last_modified() -> str:
         return f"Error: {str(e)}"
 
 
-@st.cache_data(ttl=300, show_spinner=False)  # Cache for 5 minutes - auto-refresh
-def load_data() -> IntegrationDataProcessor:
-    """Load and process Integration data"""
+def get_excel_mtime() -> float:
+    """Get the Excel file's modification time (0.0 if unavailable) - used as the data cache key"""
+    try:
+        from shared.data_paths import get_excel_file_path, INTEGRATION_FILE
+        return os.path.getmtime(get_excel_file_path(INTEGRATION_FILE))
+    except OSError:
+        return 0.0
+
+
+@st.cache_resource(ttl=300, show_spinner=False)  # Cache for 5 minutes - auto-refresh
+def load_data(excel_mtime: float) -> IntegrationDataProcessor:
+    """
+    Load and process Integration data
+
+    The processor is cached as a shared resource (no pickling per rerun)
+    and keyed on the Excel modification time, so saving the workbook
+    invalidates it immediately.
+
+    Args:
+        excel_mtime: Excel file modification time (cache key)
+    """
 
     print("[DEBUG Integration] Loading fresh data from Excel")
     df = load_integration_data()
@@ -304,18 +322,14 @@ def get_dynamic_months_integration(df: pd.DataFrame):
     Returns:
         tuple: (tab_labels, month_keys, month_names)
     """
-    # Get unique year-month combinations from data (use copy to avoid modifying original)
-    temp_df = df.copy()
-
-    # Filter out rows with NaN/null dates
-    temp_df = temp_df[temp_df['Go Live Date'].notna()]
+    # Get unique year-month combinations from the Go Live Date column only, excluding NaN/null dates
+    valid_dates = df['Go Live Date'].dropna()
 
-    if len(temp_df) == 0:
+    if len(valid_dates) == 0:
         # No valid dates, return empty lists with just YTD
         return ['YTD'], ['ytd'], ['YTD (All Months)']
 
-    temp_df['YearMonth'] = temp_df['Go Live Date'].dt.to_period('M')
-    unique_months = sorted(temp_df['YearMonth'].dropna().unique())
+    unique_months = sorted(valid_dates.dt.to_period('M').unique())
 
     tab_labels = []
     month_keys = []
@@ -349,6 +363,7 @@ def render_data_tab(processor: IntegrationDataProcessor):
     with col2:
         if st.button("🔄 Reload Latest Data", help="Clear cache and reload data from Excel file"):
             st.cache_data.clear()
+            load_data.clear()
             st.session_state.integration_selected_kpi = None
             st.session_state.integration_selected_region = None
             st.success("✅ Data reloaded successfully!")
@@ -395,7 +410,7 @@ def render_integration_dashboard():
     
     # Load data
     with st.spinner("Loading Integration data..."):
-        processor = load_data()
+        processor = load_data(get_excel_mtime())
     
     # Render modern header
     render_modern_header("Integration Dashboard", "https://img.icons8.com/?size=512&id=7819&format=png")
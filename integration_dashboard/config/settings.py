@@ -30,6 +30,9 @@ EXCEL_FILE_PATH = "data/Integration Access Board.xlsx"
 SHAREPOINT_SITE_URL = ""  # To be configured
 SHAREPOINT_LIST_NAME = "Integration Access Board"
 
+# Print debug output from the data processor (off by default - it runs on every rerun)
+DEBUG = False
+
 # ============================================================================
 # DATE FILTER OPTIONS
 # ============================================================================
@@ -3,9 +3,43 @@ Excel Data Loader for Integration Dashboard
 Loads data from local Excel file and combines all month sheets
 """
 
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from shared.data_paths import get_excel_file_path, INTEGRATION_FILE
+from pathlib import Path
+from shared.data_paths import get_excel_file_path, INTEGRATION_FILE, EXCEL_ENGINE
+from shared.excel_cache import read_parquet_cache, write_parquet_cache
+from shared.column_utils import STRING_DTYPE
+
+# Parquet sidecar version - bump when _read_integration_workbook() changes its output
+CACHE_VERSION = 1
+
+# Columns to keep (including those that don't need renaming)
+COLUMNS_TO_KEEP = [
+    'Dealership Name',
+    'Go Live Date',
+    'Days to Go Live',
+    'PEM',
+    'Director',
+    'Implementation Type',
+    'Region',
+    'Assignee',
+    'Vendor List Updated'
+]
+
+# Text columns are read as strings directly, skipping per-cell type inference
+TEXT_COLUMN_DTYPES = {
+    col: STRING_DTYPE for col in [
+        'Dealership Name',
+        'PEM',
+        'Director',
+        'Implementation Type',
+        'Region',
+        'Assignee',
+        'Vendor List Updated'
+    ]
+}
 
 
 def load_integration_data_from_excel():
@@ -33,16 +67,67 @@ def load_integration_data_from_excel():
     if not excel_path.exists():
         raise FileNotFoundError(f"Excel file not found: {excel_path}")
 
+    # Reuse the parsed workbook if neither the Excel file nor the loader has changed
+    df = read_parquet_cache(excel_path, CACHE_VERSION)
+    if df is None:
+        df = _read_integration_workbook(excel_path)
+        write_parquet_cache(excel_path, df, CACHE_VERSION)
+
+    # Days to Go Live is already in Excel, but recalculate to ensure consistency
+    today = datetime.now()
+    if 'Go Live Date' in df.columns:
+        df['Days to Go Live'] = (df['Go Live Date'] - today).dt.days
+        # If Days to Go Live < 0, mark as "Rolled Out"
+        days = df['Days to Go Live'].astype('Int64')
+        df['Days to Go Live Display'] = np.where(
+            days.lt(0).fillna(False), 'Rolled Out', days.astype(STRING_DTYPE).fillna('')
+        )
+
+    # Handle NA/blank values - replace with pd.NA
+    na_values = ['nan', 'NA', 'N/A', 'na', 'n/a', '', 'None']
+    text_cols = df.select_dtypes(include=['object', 'string']).columns
+    df[text_cols] = df[text_cols].mask(df[text_cols].isin(na_values), pd.NA)
+
+    print(f"[INFO Integration Loader] Final data shape: {df.shape}")
+
+    return df
+
+
+def _read_integration_workbook(excel_path: Path) -> pd.DataFrame:
+    """
+    Parse all month sheets of the Integration workbook
+
+    Only covers the steps that depend on the file contents (not on today's
+    date), so the result can be cached until the Excel file changes.
+
+    Args:
+        excel_path: Path to the Excel file
+
+    Returns:
+        pd.DataFrame: Combined, renamed and trimmed sheet data
+    """
     # Read all sheets and combine them
-    xl = pd.ExcelFile(excel_path)
-    all_data = []
+    with pd.ExcelFile(excel_path, engine=EXCEL_ENGINE) as xl:
+        sheet_names = xl.sheet_names
+
+    print(f"[INFO Integration Loader] Found sheets: {sheet_names}")
+
+    # Parse month sheets in parallel - each worker opens its own reader,
+    # and executor.map keeps the results in sheet order
+    def read_sheet(sheet_name: str) -> pd.DataFrame:
+        return pd.read_excel(
+            excel_path,
+            sheet_name=sheet_name,
+            engine=EXCEL_ENGINE,
+            usecols=lambda col: str(col).strip() in COLUMNS_TO_KEEP,
+            dtype=TEXT_COLUMN_DTYPES
+        )
 
-    print(f"[INFO Integration Loader] Found sheets: {xl.sheet_names}")
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(sheet_names)))) as executor:
+        all_data = list(executor.map(read_sheet, sheet_names))
 
-    for sheet_name in xl.sheet_names:
-        df_sheet = pd.read_excel(excel_path, sheet_name=sheet_name)
+    for sheet_name, df_sheet in zip(sheet_names, all_data):
         print(f"[INFO Integration Loader] Sheet '{sheet_name}': {len(df_sheet)} rows")
-        all_data.append(df_sheet)
 
     # Combine all sheets
     df = pd.concat(all_data, ignore_index=True)
@@ -59,21 +144,8 @@ def load_integration_data_from_excel():
         'Assignee': 'Assigned To'  # Excel has "Assignee", code expects "Assigned To"
     }
 
-    # Columns to keep (including those that don't need renaming)
-    columns_to_keep = [
-        'Dealership Name',
-        'Go Live Date',
-        'Days to Go Live',
-        'PEM',
-        'Director',
-        'Implementation Type',
-        'Region',
-        'Assignee',
-        'Vendor List Updated'
-    ]
-
     # Only keep columns that exist
-    existing_cols = [col for col in columns_to_keep if col in df.columns]
+    existing_cols = [col for col in COLUMNS_TO_KEEP if col in df.columns]
     df = df[existing_cols]
     
     # Rename columns
@@ -81,30 +153,12 @@ def load_integration_data_from_excel():
 
     print(f"[INFO Integration Loader] Columns after mapping: {df.columns.tolist()}")
 
-    # Standardize values (trim spaces)
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            df[col] = df[col].astype(str).str.strip()
+    # Standardize values (trim spaces) - single pass over all text columns
+    text_cols = df.select_dtypes(include=['object', 'string']).columns
+    df[text_cols] = df[text_cols].apply(lambda col: col.astype(STRING_DTYPE).str.strip())
 
     # Convert Go Live Date to datetime
     if 'Go Live Date' in df.columns:
         df['Go Live Date'] = pd.to_datetime(df['Go Live Date'], errors='coerce')
 
-    # Days to Go Live is already in Excel, but recalculate to ensure consistency
-    today = datetime.now()
-    if 'Go Live Date' in df.columns:
-        df['Days to Go Live'] = (df['Go Live Date'] - today).dt.days
-        # If Days to Go Live < 0, mark as "Rolled Out"
-        df['Days to Go Live Display'] = df['Days to Go Live'].apply(
-            lambda x: 'Rolled Out' if pd.notna(x) and x < 0 else (str(int(x)) if pd.notna(x) else '')
-        )
-
-    # Handle NA/blank values - replace with pd.NA
-    na_values = ['nan', 'NA', 'N/A', 'na', 'n/a', '', 'None']
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            df[col] = df[col].replace(na_values, pd.NA)
-
-    print(f"[INFO Integration Loader] Final data shape: {df.shape}")
-
     return df
@@ -5,8 +5,6 @@ Generates sample data for testing and development
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
 
 
 def generate_mock_integration_data(num_records: int = 100) -> pd.DataFrame:
@@ -20,8 +18,7 @@ def generate_mock_integration_data(num_records: int = 100) -> pd.DataFrame:
         DataFrame with mock integration data
     """
     
-    np.random.seed(42)
-    random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Sample data
     dealer_names = [
@@ -44,43 +41,32 @@ def generate_mock_integration_data(num_records: int = 100) -> pd.DataFrame:
     assignees = ['Alex Chen', 'Maria Lopez', 'Kevin Park', 'Rachel Kim', 'Brian Lee',
                  'Amanda Wang', 'Justin Nguyen', 'Nicole Patel', 'Ryan Singh', 'Lauren Kumar']
     
-    # Generate data
-    data = []
-    today = datetime.now()
-    
-    for i in range(num_records):
-        # Generate go live date (spread across past, current, and future months)
-        days_offset = random.randint(-60, 120)  # -60 to +120 days from today
-        go_live_date = today + timedelta(days=days_offset)
-        
-        # Select implementation type
-        impl_type = random.choice(implementation_types)
-        
-        # Vendor list updated (bias towards 'No' for more interesting data)
-        vendor_updated = random.choices(
-            vendor_list_updated,
-            weights=[0.3, 0.6, 0.1],  # 30% Yes, 60% No, 10% blank
-            k=1
-        )[0]
-        
-        # Randomly make some fields blank for Data Incomplete testing
-        is_incomplete = random.random() < 0.1  # 10% chance of incomplete data
-        
-        record = {
-            'Dealer Name': random.choice(dealer_names),
-            'Dealer ID': f'DLR{1000 + i}',
-            'Go Live Date': go_live_date.strftime('%Y-%m-%d'),
-            'Implementation Type': impl_type if not is_incomplete else '',
-            'Vendor List Updated': vendor_updated,
-            'PEM': random.choice(pems) if not is_incomplete else '',
-            'Director': random.choice(directors),
-            'Assigned to': random.choice(assignees) if not is_incomplete else '',
-            'Region': random.choice(regions)
-        }
-        
-        data.append(record)
-    
-    df = pd.DataFrame(data)
+    # Generate data - one vectorized draw per column
+    n = num_records
+    df = pd.DataFrame({
+        'Dealer Name': rng.choice(dealer_names, n),
+        'Dealer ID': [f'DLR{1000 + i}' for i in range(n)],
+        'Implementation Type': rng.choice(implementation_types, n),
+        # Bias towards 'No' for more interesting data: 30% Yes, 60% No, 10% blank
+        'Vendor List Updated': rng.choice(vendor_list_updated, n, p=[0.3, 0.6, 0.1]),
+        'PEM': rng.choice(pems, n),
+        'Director': rng.choice(directors, n),
+        'Assigned to': rng.choice(assignees, n),
+        'Region': rng.choice(regions, n)
+    })
+
+    # Go live dates spread across past, current, and future months (-60 to +120 days from today)
+    days_offset = rng.integers(-60, 121, n)
+    go_live_dates = pd.Timestamp.now().normalize() + pd.to_timedelta(days_offset, unit='D')
+    df.insert(2, 'Go Live Date', go_live_dates.strftime('%Y-%m-%d'))
+
+    # Randomly make some fields blank for Data Incomplete testing (10% of records)
+    is_incomplete = rng.random(n) < 0.1
+    df.loc[is_incomplete, ['Implementation Type', 'PEM', 'Assigned to']] = ''
+
+    # Build Dealership Name once at load, in the Excel format ("Dealer Name - Dealer ID"),
+    # so the processor receives it ready-made like it does from the Excel loader
+    df['Dealership Name'] = df['Dealer Name'] + ' - ' + df['Dealer ID']
     
     print(f"[DEBUG Integration] Generated {len(df)} mock records")
     print(f"[DEBUG Integration] Columns: {df.columns.tolist()}")
@@ -10,12 +10,24 @@ from typing import Dict, List, Optional
 
 from integration_dashboard.config.settings import (
     THRESHOLDS,
-    REQUIRED_FIELDS,
     DISPLAY_COLUMNS,
     DATE_FORMAT,
-    DISPLAY_DATE_FORMAT
+    DISPLAY_DATE_FORMAT,
+    DEBUG
 )
-from shared.column_utils import find_column, has_column
+from shared.column_utils import find_column, has_column, normalize_regions
+
+# Status codes produced by _calculate_status
+STATUS_LABELS = np.array(['GTG', 'Escalated', 'Critical', 'On Track'], dtype=object)
+
+# Threshold lookup table: one row per implementation type, columns are
+# on_track, critical_min, critical_max, escalated
+THRESHOLD_TYPES = list(THRESHOLDS.keys())
+THRESHOLD_TABLE = np.array(
+    [[t['on_track'], t['critical_min'], t['critical_max'], t['escalated']] for t in THRESHOLDS.values()],
+    dtype=np.float64
+)
+DEFAULT_THRESHOLD_CODE = THRESHOLD_TYPES.index('Buy/Sell')
 
 
 class IntegrationDataProcessor:
@@ -28,8 +40,25 @@ class IntegrationDataProcessor:
         Args:
             df: Raw integration data
         """
+        # "Today" is fixed for the processor's lifetime (processors are cached per load)
+        self._today = pd.Timestamp.now().normalize()
+        self._next_week = self._today + pd.Timedelta(days=7)
+
         self.df = self._prepare_data(df)
-        print(f"[DEBUG Integration Processor] Initialized with {len(self.df)} records")
+
+        # Full-dataset regions, computed once - get_regions() returns these
+        self._regions = self._extract_regions(self.df)
+
+        # Go Live within the next 7 days - shared by get_kpis and get_upcoming_week_data
+        self._upcoming_week_mask = (
+            (self.df['Go Live Date'] >= self._today) &
+            (self.df['Go Live Date'] <= self._next_week)
+        )
+
+        # Row positions per Go Live month - reused by every filter_by_date_range call
+        self._month_positions = self.df.groupby('Go Live Month').indices
+        if DEBUG:
+            print(f"[DEBUG Integration Processor] Initialized with {len(self.df)} records")
     
     def _prepare_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -44,7 +73,8 @@ class IntegrationDataProcessor:
         df = df.copy()
 
         # Print available columns for debugging
-        print(f"[DEBUG Integration Processor] Available columns: {df.columns.tolist()}")
+        if DEBUG:
+            print(f"[DEBUG Integration Processor] Available columns: {df.columns.tolist()}")
 
         # Check for required columns and add defaults if missing
         required_cols = {
@@ -63,109 +93,79 @@ class IntegrationDataProcessor:
                 print(f"[WARNING] Column '{col}' not found, adding with default value")
                 df[col] = default_val
 
-        # Convert Go Live Date to datetime
-        df['Go Live Date'] = pd.to_datetime(df['Go Live Date'], errors='coerce')
+        # Convert Go Live Date to datetime (the Excel loader already delivers datetimes)
+        if not pd.api.types.is_datetime64_any_dtype(df['Go Live Date']):
+            df['Go Live Date'] = pd.to_datetime(df['Go Live Date'], errors='coerce')
 
         # Extract month and year for filtering
         df['Go Live Month'] = df['Go Live Date'].dt.month
         df['Go Live Year'] = df['Go Live Date'].dt.year
 
         # Calculate Days to Go Live
-        today = pd.Timestamp.now().normalize()
-        df['Days to Go Live'] = (df['Go Live Date'] - today).dt.days
+        df['Days to Go Live'] = (df['Go Live Date'] - self._today).dt.days
 
         # Dealership Name already provided by loader - no need to create
 
 
         # Calculate Status
-        df['Status'] = df.apply(self._calculate_status, axis=1)
+        df['Status'] = self._calculate_status(df)
+
+        # Canonical region names (e.g. "usa east " -> "USA East"), matched exactly by filters
+        df['Region'] = normalize_regions(df['Region'])
 
-        # Check for Data Incomplete
-        # df['Is Data Incomplete'] = df.apply(self._is_data_incomplete, axis=1)  # Removed - no longer needed
+        # Low-cardinality columns as categoricals: equality filters become integer compares
+        for col in ['Region', 'Status', 'Implementation Type']:
+            df[col] = df[col].astype('category')
 
-        print(f"[DEBUG Integration Processor] Data prepared: {len(df)} records")
-        print(f"[DEBUG Integration Processor] Final columns: {df.columns.tolist()}")
+        if DEBUG:
+            print(f"[DEBUG Integration Processor] Data prepared: {len(df)} records")
+            print(f"[DEBUG Integration Processor] Final columns: {df.columns.tolist()}")
 
         return df
     
-    def _calculate_status(self, row) -> str:
+    def _calculate_status(self, df: pd.DataFrame) -> np.ndarray:
         """
         Calculate status based on business rules
 
+        Rules (by Implementation Type thresholds, Buy/Sell if type unknown):
+        - GTG: Vendor List Updated = 'Yes', or Go Live already passed
+        - Escalated / Critical / On Track: by Days to Go Live
+
         Args:
-            row: DataFrame row
+            df: DataFrame with Status (Vendor List Updated), Implementation Type
+                and Days to Go Live columns
 
         Returns:
-            Status string
+            Array of status strings
         """
-        # Check for Data Incomplete first
-        if self._is_data_incomplete(row):
-            pass  # Data Incomplete removed
-
-        # Safely get Vendor List Updated value
-        vendor_list_updated = row.get('Status', '')
-
-        # GTG: Vendor List Updated = 'Yes'
-        if pd.notna(vendor_list_updated) and str(vendor_list_updated).strip().lower() == 'yes':
-            return 'GTG'
-
-        # For other statuses, Vendor List Updated must be 'No'
-        if pd.isna(vendor_list_updated) or str(vendor_list_updated).strip().lower() != 'no':
-            pass  # Data Incomplete removed
-
-        # Get implementation type and days to go live
-        impl_type = row.get('Implementation Type', '')
-        days = row.get('Days to Go Live', 0)
-
-        # Handle missing implementation type
-        if pd.isna(impl_type) or impl_type == '':
-            pass  # Data Incomplete removed
-
-        # Handle NaN days
-        if pd.isna(days):
-            pass  # Data Incomplete removed
-
-        # Handle rolled out (negative days)
-        if days < 0:
-            return 'GTG'  # Already rolled out
-
-        # Get thresholds for this implementation type
-        thresholds = THRESHOLDS.get(impl_type)
-        if not thresholds:
-            # Default to Buy/Sell thresholds if type not found
-            thresholds = THRESHOLDS['Buy/Sell']
-
-        # Escalated
-        if days < thresholds['escalated']:
-            return 'Escalated'
-
-        # Critical
-        if thresholds['critical_min'] <= days <= thresholds['critical_max']:
-            return 'Critical'
-
-        # On Track
-        if days > thresholds['on_track']:
-            return 'On Track'
-
-        # Default to Critical if between escalated and on_track
-        return 'Critical'
-    
-    def _is_data_incomplete(self, row) -> bool:
-        """
-        Check if row has incomplete data
+        vendor_yes = (
+            df['Status'].astype('string').str.strip().str.lower().eq('yes')
+            .fillna(False).to_numpy(dtype=np.bool_)
+        )
 
-        Args:
-            row: DataFrame row
+        impl_codes = df['Implementation Type'].map(
+            {impl_type: code for code, impl_type in enumerate(THRESHOLD_TYPES)}
+        ).fillna(DEFAULT_THRESHOLD_CODE)
+
+        days = pd.to_numeric(df['Days to Go Live'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # Per-row thresholds gathered from the lookup table
+        on_track, critical_min, critical_max, escalated = THRESHOLD_TABLE[impl_codes.to_numpy(dtype=np.int64)].T
+
+        # First matching rule wins; unknown days and the gap between escalated
+        # and on_track default to Critical
+        codes = np.select(
+            [
+                vendor_yes | (days < 0),
+                days < escalated,
+                (days >= critical_min) & (days <= critical_max),
+                days > on_track
+            ],
+            [0, 1, 2, 3],
+            default=2
+        )
 
-        Returns:
-            True if data is incomplete
-        """
-        for field in REQUIRED_FIELDS:
-            if field in row.index:
-                value = row.get(field, '')
-                if pd.isna(value) or str(value).strip() == '':
-                    return True
-        return False
+        return np.take(STATUS_LABELS, codes)
     
     def get_upcoming_week_data(self) -> pd.DataFrame:
         """
@@ -174,17 +174,12 @@ class IntegrationDataProcessor:
         Returns:
             DataFrame with upcoming week go lives
         """
-        today = pd.Timestamp.now().normalize()
-        next_week = today + pd.Timedelta(days=7)
-        
         # Filter: Go Live Date between today and 7 days from now
-        upcoming = self.df[
-            (self.df['Go Live Date'] >= today) &
-            (self.df['Go Live Date'] <= next_week)
-        ].copy()
+        upcoming = self.df[self._upcoming_week_mask]
         
-        print(f"[DEBUG Integration Processor] Upcoming Week Go Lives: {len(upcoming)} records")
-        print(f"[DEBUG Integration Processor] Date range: {today.date()} to {next_week.date()}")
+        if DEBUG:
+            print(f"[DEBUG Integration Processor] Upcoming Week Go Lives: {len(upcoming)} records")
+            print(f"[DEBUG Integration Processor] Date range: {self._today.date()} to {self._next_week.date()}")
         
         return upcoming
     
@@ -196,11 +191,11 @@ class IntegrationDataProcessor:
             date_filter: lowercase month name ('january', 'february', etc.) or 'ytd'
 
         Returns:
-            Filtered DataFrame
+            Filtered DataFrame (a view of the processor data - do not modify in place)
         """
         if date_filter == 'ytd':
             # YTD: All data (entire dataset)
-            filtered = self.df.copy()
+            filtered = self.df
         else:
             # Map month names to numbers
             month_map = {
@@ -212,13 +207,14 @@ class IntegrationDataProcessor:
             if date_filter.lower() in month_map:
                 month_num = month_map[date_filter.lower()]
                 # Filter by month (any year in the data)
-                mask = self.df['Go Live Date'].dt.month == month_num
-                filtered = self.df[mask].copy()
+                positions = self._month_positions.get(month_num, [])
+                filtered = self.df.iloc[positions]
             else:
                 # Unknown filter, return all data
-                filtered = self.df.copy()
+                filtered = self.df
 
-        print(f"[DEBUG Integration Processor] Filtered by {date_filter}: {len(filtered)} records")
+        if DEBUG:
+            print(f"[DEBUG Integration Processor] Filtered by {date_filter}: {len(filtered)} records")
 
         return filtered
     
@@ -233,53 +229,65 @@ class IntegrationDataProcessor:
             Dictionary of KPI name to count
         """
         # Calculate Upcoming Week count (next 7 days from today)
-        today = pd.Timestamp.now().normalize()
-        next_week = today + pd.Timedelta(days=7)
-        upcoming_week_count = len(self.df[
-            (self.df['Go Live Date'] >= today) &
-            (self.df['Go Live Date'] <= next_week)
-        ])
+        upcoming_week_count = int(self._upcoming_week_mask.sum())
         
+        # Count all statuses in one pass
+        status_counts = df['Status'].value_counts()
+
         kpis = {
             'Total Go Lives': len(df),
-            'GTG': len(df[df['Status'] == 'GTG']),
-            'On Track': len(df[df['Status'] == 'On Track']),
-            'Critical': len(df[df['Status'] == 'Critical']),
-            'Escalated': len(df[df['Status'] == 'Escalated']),
+            'GTG': int(status_counts.get('GTG', 0)),
+            'On Track': int(status_counts.get('On Track', 0)),
+            'Critical': int(status_counts.get('Critical', 0)),
+            'Escalated': int(status_counts.get('Escalated', 0)),
             'Upcoming Week': upcoming_week_count,
-            # 'Data Incomplete': removed
         }
         
-        print(f"[DEBUG Integration Processor] KPIs: {kpis}")
+        if DEBUG:
+            print(f"[DEBUG Integration Processor] KPIs: {kpis}")
         
         return kpis
     
     def get_regions(self, df: Optional[pd.DataFrame] = None) -> List[str]:
         """Get unique regions from data"""
-        if df is None:
-            df = self.df
+        if df is None or df is self.df:
+            # Full-dataset regions are computed once in __init__
+            return list(self._regions)
+        return self._extract_regions(df)
+
+    @staticmethod
+    def _extract_regions(df: pd.DataFrame) -> List[str]:
+        """
+        Extract region options from a DataFrame
+
+        Args:
+            df: DataFrame with a Region column
 
+        Returns:
+            'All' followed by the regions in alphabetical order
+        """
         # Safety check: ensure Region column exists
         if 'Region' not in df.columns:
-            print("[DEBUG Integration] 'Region' column missing in DataFrame!")
+            if DEBUG:
+                print("[DEBUG Integration] 'Region' column missing in DataFrame!")
             return ['All']
 
-        # Normalize regions: strip whitespace, title case (create new series to avoid warning)
-        normalized_regions = df['Region'].astype(str).str.strip().str.title()
-        
+        # Regions are already canonical (normalized in _prepare_data)
         # Get unique regions, excluding NaN and empty values
-        regions = [r for r in normalized_regions.unique() if r and r != 'Nan']
+        regions = [r for r in df['Region'].dropna().astype(str).unique() if r]
         
         # If no regions found, return default
         if not regions:
-            print("[DEBUG Integration] No regions found, returning default")
+            if DEBUG:
+                print("[DEBUG Integration] No regions found, returning default")
             return ['All']
 
         # Sort regions alphabetically, then add 'All' at the beginning
         sorted_regions = sorted(regions)
         region_options = ['All'] + sorted_regions
         
-        print(f"[DEBUG Integration] Regions extracted: {region_options}")
+        if DEBUG:
+            print(f"[DEBUG Integration] Regions extracted: {region_options}")
         return region_options
 
     def get_region_counts(self, status: str, df: pd.DataFrame) -> Dict[str, int]:
@@ -298,21 +306,14 @@ class IntegrationDataProcessor:
         else:
             status_df = df[df['Status'] == status]
         
-        region_counts = {}
-        for region in self.get_regions():  # Use full dataset
-            if region == 'All':
-                # "All" should show total count across all regions
-                count = len(status_df)
-            else:
-                # Normalize region name for comparison (case-insensitive)
-                normalized_region = region.upper().replace(' ', '').replace('_', '')
-                # Count records where region matches (case-insensitive)
-                count = len(status_df[
-                    status_df['Region'].astype(str).str.upper().str.replace(' ', '').str.replace('_', '') == normalized_region
-                ])
-            region_counts[region] = count
+        # Region holds canonical names (normalized in _prepare_data), so one groupby pass
+        # counts every region of the full dataset; "All" shows the total across all regions
+        counts = status_df.groupby('Region', observed=True).size()
+        region_counts = counts.reindex(self._regions, fill_value=0).to_dict()
+        region_counts['All'] = len(status_df)
         
-        print(f"[DEBUG Integration Processor] Region counts for {status}: {region_counts}")
+        if DEBUG:
+            print(f"[DEBUG Integration Processor] Region counts for {status}: {region_counts}")
         
         return region_counts
     
@@ -328,10 +329,11 @@ class IntegrationDataProcessor:
             Filtered DataFrame
         """
         if region == 'All':
-            filtered = df.copy()
+            filtered = df
         else:
-            filtered = df[df['Region'] == region].copy()
-        print(f"[DEBUG Integration Processor] Filtered by region {region}: {len(filtered)} records")
+            filtered = df[df['Region'] == region]
+        if DEBUG:
+            print(f"[DEBUG Integration Processor] Filtered by region {region}: {len(filtered)} records")
         return filtered
     
     def get_display_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -344,20 +346,20 @@ class IntegrationDataProcessor:
         Returns:
             Display-ready DataFrame
         """
-        display_df = df.copy()
+        # Select and order display columns - only this subset is copied and formatted
+        available_cols = [col for col in DISPLAY_COLUMNS if col in df.columns]
+        display_df = df[available_cols].copy()
         
         # Format Go Live Date
         display_df['Go Live Date'] = display_df['Go Live Date'].dt.strftime(DISPLAY_DATE_FORMAT)
         
         # Format Days to Go Live (show "Rolled Out" for negative values)
-        display_df['Days to Go Live'] = display_df['Days to Go Live'].apply(
-            lambda x: "Rolled Out" if x < 0 else str(int(x))
+        days = display_df['Days to Go Live'].astype('Int64')
+        display_df['Days to Go Live'] = np.where(
+            days.lt(0).fillna(False), "Rolled Out", days.astype('string').fillna('')
         )
         
-        # Select and order display columns
-        available_cols = [col for col in DISPLAY_COLUMNS if col in display_df.columns]
-        display_df = display_df[available_cols].copy()
-        
-        print(f"[DEBUG Integration Processor] Display DataFrame ready: {len(display_df)} records")
+        if DEBUG:
+            print(f"[DEBUG Integration Processor] Display DataFrame ready: {len(display_df)} records")
         
         return display_df
@@ -3,7 +3,7 @@ Launch script for ARC Configuration Dashboard
 Simple one-click launcher
 """
 
-import subprocess
+import os
 import sys
 from pathlib import Path
 
@@ -22,9 +22,10 @@ def main():
     print("Press Ctrl+C to stop the server.\n")
     print("=" * 60)
     
-    # Launch Streamlit
+    # Launch Streamlit - replaces this launcher process, so Streamlit owns the
+    # terminal directly (Ctrl+C goes straight to the server)
     try:
-        subprocess.run([
+        os.execvp(sys.executable, [
             sys.executable,
             "-m",
             "streamlit",
@@ -33,9 +34,7 @@ def main():
             "--server.port=8501",
             "--server.headless=false"
         ])
-    except KeyboardInterrupt:
-        print("\n\n✅ Dashboard stopped successfully")
-    except Exception as e:
+    except OSError as e:
         print(f"\n❌ Error launching dashboard: {e}")
         sys.exit(1)
 
@@ -4,10 +4,14 @@ Regression Testing Dashboard - Main Application
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import sys
 from pathlib import Path
 import calendar
+import io
+import math
+import os
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -44,13 +48,27 @@ def initialize_session_state():
 # DATA LOADING
 # ============================================================================
 
-@st.cache_data(ttl=300, show_spinner=False)  # Cache for 5 minutes - auto-refresh
-def load_data(use_mock: bool = False):
+def get_excel_mtime() -> float:
+    """Get the Excel file's modification time (0.0 if unavailable) - used as the data cache key"""
+    try:
+        from shared.data_paths import get_excel_file_path, REGRESSION_FILE
+        return os.path.getmtime(get_excel_file_path(REGRESSION_FILE))
+    except OSError:
+        return 0.0
+
+
+@st.cache_resource(ttl=300, show_spinner=False)  # Cache for 5 minutes - auto-refresh
+def load_data(use_mock: bool = False, excel_mtime: float = 0.0):
     """
     Load data from Excel file (Stores Checklist sheet) or mock data
 
+    The processor is cached as a shared resource (no pickling per rerun), so
+    its per-month results survive reruns such as a region button click. It is
+    keyed on the Excel modification time, so saving the workbook invalidates it.
+
     Args:
         use_mock: Whether to use mock data (default: False - use real Excel data)
+        excel_mtime: Excel file modification time (cache key)
 
     Returns:
         RegressionDataProcessor: Data processor instance with loaded data
@@ -84,15 +102,15 @@ def load_data(use_mock: bool = False):
 def render_kpi_cards(kpis: dict, month_key: str = ""):
     """Render KPI cards with aligned buttons"""
     # Build KPI cards HTML
-    cards_html = '<div class="kpi-row">'
+    cards_html = ['<div class="kpi-row">']
 
     for kpi_name, kpi_value in kpis.items():
         color_class = KPI_COLORS.get(kpi_name, 'kpi-grey')
         selected_class = 'selected' if kpi_name == st.session_state.regression_selected_kpi else ''
-        cards_html += f'<div class="kpi-card {color_class} {selected_class}">{kpi_value}<br /><span style="font-size:0.55em;">{kpi_name}</span></div>'
+        cards_html.append(f'<div class="kpi-card {color_class} {selected_class}">{kpi_value}<br /><span style="font-size:0.55em;">{kpi_name}</span></div>')
 
-    cards_html += '</div>'
-    st.markdown(cards_html, unsafe_allow_html=True)
+    cards_html.append('</div>')
+    st.markdown(''.join(cards_html), unsafe_allow_html=True)
 
     # Handle button clicks
     cols = st.columns(len(kpis))
@@ -109,14 +127,14 @@ def render_implementation_type_pills(impl_types: list, current_selection: str, m
     st.markdown("#### 🏷️ Type of Implementation")
 
     # Build pills HTML
-    pills_html = '<div class="impl-type-row">'
+    pills_html = ['<div class="impl-type-row">']
 
     for impl_type in impl_types:
         selected_class = 'selected' if impl_type == current_selection else ''
-        pills_html += f'<div class="impl-type-btn {selected_class}">{impl_type}</div>'
+        pills_html.append(f'<div class="impl-type-btn {selected_class}">{impl_type}</div>')
 
-    pills_html += '</div>'
-    st.markdown(pills_html, unsafe_allow_html=True)
+    pills_html.append('</div>')
+    st.markdown(''.join(pills_html), unsafe_allow_html=True)
 
     # Handle button clicks
     cols = st.columns(len(impl_types))
@@ -139,19 +157,19 @@ def render_region_buttons(region_counts: dict, month_key: str = ""):
     st.markdown("#### 🌍 Regions")
 
     # Build regions HTML
-    regions_html = '<div class="region-row">'
+    regions_html = ['<div class="region-row">']
 
     # Add "All Regions" option
     all_count = sum(active_regions.values())
     selected_class = 'selected' if st.session_state.regression_selected_region == 'All Regions' else ''
-    regions_html += f'<div class="region-btn {selected_class}">All Regions ({all_count})</div>'
+    regions_html.append(f'<div class="region-btn {selected_class}">All Regions ({all_count})</div>')
 
     for region, count in active_regions.items():
         selected_class = 'selected' if region == st.session_state.regression_selected_region else ''
-        regions_html += f'<div class="region-btn {selected_class}">{region} ({count})</div>'
+        regions_html.append(f'<div class="region-btn {selected_class}">{region} ({count})</div>')
 
-    regions_html += '</div>'
-    st.markdown(regions_html, unsafe_allow_html=True)
+    regions_html.append('</div>')
+    st.markdown(''.join(regions_html), unsafe_allow_html=True)
 
     # Handle button clicks
     all_regions = ['All Regions'] + list(active_regions.keys())
@@ -159,22 +177,55 @@ def render_region_buttons(region_counts: dict, month_key: str = ""):
     for idx, region in enumerate(all_regions):
         with cols[idx]:
             if st.button(f"{region}", key=f"regression_region_btn_{region}_{month_key}"):
-                st.session_state.regression_selected_region = region
-                st.rerun()
+                # Re-clicking the selected region changes nothing - skip the extra rerun
+                if st.session_state.regression_selected_region != region:
+                    st.session_state.regression_selected_region = region
+                    st.rerun()
+
+
+@st.cache_data(show_spinner=False)
+def convert_df_to_csv(df: pd.DataFrame) -> bytes:
+    """
+    Encode a table as CSV - cached, so reruns with unchanged data skip the encode
+
+    Uses Arrow's C++ CSV writer into an in-memory buffer when pyarrow is installed,
+    pandas' writer otherwise. The two files differ in quoting: Arrow quotes the header
+    and every text field (so a blank text cell is written as "", a missing one stays
+    empty) and writes whole-number floats without the trailing ".0". Arrow has no
+    minimal-quoting mode - its default "needed" style already quotes all strings.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return df.to_csv(index=False).encode('utf-8')
+
+    buffer = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer)
+    return buffer.getvalue()
 
 
 def render_data_table(df: pd.DataFrame, month_key: str = ""):
     """Render data table"""
     st.markdown("#### 📋 Data Table")
 
+    # Large tables are shown one page at a time to limit what is sent to the browser
+    page_df = df
+    if len(df) > TABLE_PAGE_SIZE:
+        num_pages = math.ceil(len(df) / TABLE_PAGE_SIZE)
+        page = st.slider("Page", 1, num_pages, 1, key=f"regression_table_page_{month_key}")
+        start = (page - 1) * TABLE_PAGE_SIZE
+        page_df = df.iloc[start:start + TABLE_PAGE_SIZE]
+        st.caption(f"Showing rows {start + 1}-{start + len(page_df)} of {len(df)}")
+
     st.dataframe(
-        df,
+        page_df,
         use_container_width=True,
         hide_index=True
     )
 
-    # Export button
-    csv = df.to_csv(index=False)
+    # Export button (always exports the full table)
+    csv = convert_df_to_csv(df)
     st.download_button(
         label="📥 Download CSV",
         data=csv,
@@ -188,25 +239,25 @@ def render_data_table(df: pd.DataFrame, month_key: str = ""):
 # MAIN TABS
 # ============================================================================
 
-def get_dynamic_months_regression(df: pd.DataFrame):
+@st.cache_data(ttl=300, show_spinner=False)
+def get_dynamic_months_regression(go_live_dates: pd.Series):
     """
     Dynamically detect all months from data and return tab labels, keys, and full names
 
+    Args:
+        go_live_dates: Go Live Date column (only this column is hashed by the cache)
+
     Returns:
         tuple: (tab_labels, month_keys, month_names)
     """
-    # Get unique year-month combinations from data (use copy to avoid modifying original)
-    temp_df = df.copy()
-
-    # Filter out rows with NaN/null dates
-    temp_df = temp_df[temp_df['Go Live Date'].notna()]
+    # Get unique year-month combinations from data, excluding NaN/null dates
+    valid_dates = go_live_dates.dropna()
 
-    if len(temp_df) == 0:
+    if len(valid_dates) == 0:
         # No valid dates, return empty lists with just YTD
         return ['YTD'], ['ytd'], ['YTD (All Months)']
 
-    temp_df['YearMonth'] = temp_df['Go Live Date'].dt.to_period('M')
-    unique_months = sorted(temp_df['YearMonth'].dropna().unique())
+    unique_months = np.sort(valid_dates.dt.to_period('M').unique())
 
     tab_labels = []
     month_keys = []
@@ -239,8 +290,8 @@ def render_month_data_regression(processor: RegressionDataProcessor, month_key:
 
     st.markdown("---")
     
-    # Get KPIs for filtered data
-    kpis = processor.get_kpis(filtered_df)
+    # Get KPIs for filtered data (computed once per month, reused on later reruns)
+    kpis = processor.get_month_kpis(month_key, filtered_df)
     
     # Render KPI cards
     st.markdown("### 📊 Key Performance Indicators")
@@ -253,72 +304,26 @@ def render_month_data_regression(processor: RegressionDataProcessor, month_key:
     
     st.markdown("---")
     
-    # Filter by implementation type
-    impl_filtered_df = processor.filter_by_implementation_type(
-        st.session_state.regression_selected_impl_type,
-        filtered_df
-    )
-    
     # Show selected KPI and Type
     if st.session_state.regression_selected_kpi:
         st.info(f"📌 Selected: **{st.session_state.regression_selected_kpi}** | Type: **{st.session_state.regression_selected_impl_type}**")
         
-        # Get region counts
-        if st.session_state.regression_selected_kpi == 'Total Go Live':
-            region_counts = {region: len(impl_filtered_df[impl_filtered_df['Region'] == region]) 
-                           for region in processor.get_regions(impl_filtered_df)}
-        elif st.session_state.regression_selected_kpi == 'Upcoming Next Week':
-            # Use upcoming week data
-            today = pd.Timestamp.now().normalize()
-            next_week = today + pd.Timedelta(days=7)
-            upcoming_df = processor.df[
-                (processor.df['SIM Start Date'] >= today) &
-                (processor.df['SIM Start Date'] <= next_week)
-            ]
-            upcoming_filtered = processor.filter_by_implementation_type(
-                st.session_state.regression_selected_impl_type,
-                upcoming_df
-            )
-            region_counts = {region: len(upcoming_filtered[upcoming_filtered['Region'] == region]) 
-                           for region in processor.get_regions(processor.df)}
-        elif st.session_state.regression_selected_kpi == 'Data Incomplete':
-            # Use data incomplete logic
-            today = pd.Timestamp.now().normalize()
-            incomplete_df = processor.df[
-                (processor.df['SIM Start Date'] < today) &
-                (processor.df['Status'].isna() | (processor.df['Status'] == ''))
-            ]
-            incomplete_filtered = processor.filter_by_implementation_type(
-                st.session_state.regression_selected_impl_type,
-                incomplete_df
-            )
-            region_counts = {region: len(incomplete_filtered[incomplete_filtered['Region'] == region]) 
-                           for region in processor.get_regions(processor.df)}
-        else:
-            region_counts = processor.get_region_counts(
-                st.session_state.regression_selected_kpi,
-                impl_filtered_df
-            )
+        # Rows behind the selected KPI card, filtered by implementation type
+        kpi_df = processor.filter_by_kpi(
+            st.session_state.regression_selected_kpi,
+            st.session_state.regression_selected_impl_type,
+            filtered_df
+        )
         
         # Render region buttons
-        render_region_buttons(region_counts, month_key)
+        render_region_buttons(processor.region_counts(kpi_df), month_key)
         
         # Show table when region is selected
         if st.session_state.regression_selected_region:
             st.markdown("---")
             
             # Filter by region
-            if st.session_state.regression_selected_kpi == 'Upcoming Next Week':
-                region_filtered_df = processor.filter_by_region(st.session_state.regression_selected_region, upcoming_filtered)
-            elif st.session_state.regression_selected_kpi == 'Data Incomplete':
-                region_filtered_df = processor.filter_by_region(st.session_state.regression_selected_region, incomplete_filtered)
-            else:
-                region_filtered_df = processor.filter_by_region(st.session_state.regression_selected_region, impl_filtered_df)
-                
-                if st.session_state.regression_selected_kpi != 'Total Go Live':
-                    region_filtered_df = region_filtered_df[
-                        region_filtered_df['Status'] == st.session_state.regression_selected_kpi
-                    ]
+            region_filtered_df = processor.filter_by_region(st.session_state.regression_selected_region, kpi_df)
             
             # Prepare display dataframe
             display_df = processor.get_display_dataframe(region_filtered_df)
@@ -331,7 +336,7 @@ def render_data_tab(processor: RegressionDataProcessor):
     """Render Data tab with dynamic month tabs"""
 
     # Get dynamic months from data
-    tab_labels, month_keys, month_names = get_dynamic_months_regression(processor.df)
+    tab_labels, month_keys, month_names = get_dynamic_months_regression(processor.df['Go Live Date'])
 
     # Create month tabs
     month_tabs = st.tabs(tab_labels)
@@ -365,7 +370,7 @@ def render_regression_dashboard():
     initialize_session_state()
     
     # Load data
-    processor = load_data(USE_MOCK_DATA)
+    processor = load_data(USE_MOCK_DATA, get_excel_mtime())
     
     # Create sub-tabs
     tab1, tab2 = st.tabs(["📊 Data", "📈 Analytics"])
@@ -11,6 +11,9 @@ USE_MOCK_DATA = False  # Set to True for mock data, False for real Excel data
 EXCEL_FILE_PATH = "data/E2E Testing Check.xlsx"
 SHEET_NAME = "Stores Checklist"
 
+# Print debug output from the data processor (off by default - it runs on every rerun)
+DEBUG = False
+
 # Date filter options (sub-tabs)
 DATE_FILTERS = {
     'current_month': 'Current Month',
@@ -73,6 +76,9 @@ DISPLAY_COLUMNS = [
     'Status'
 ]
 
+# Maximum rows shown per page in the data table (CSV export always has all rows)
+TABLE_PAGE_SIZE = 500
+
 # Date format
 DATE_FORMAT = '%Y-%m-%d'
 DISPLAY_DATE_FORMAT = '%d-%b-%Y'
@@ -3,9 +3,30 @@ Excel Data Loader for Regression Testing Dashboard
 Loads data from local Excel file - ONLY "Stores Checklist" sheet
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from shared.data_paths import get_excel_file_path, REGRESSION_FILE
+from pathlib import Path
+from shared.data_paths import get_excel_file_path, REGRESSION_FILE, EXCEL_ENGINE
+from shared.excel_cache import read_parquet_cache, write_parquet_cache
+from shared.column_utils import STRING_DTYPE
+from regression_dashboard.config.settings import DATE_FORMAT
+
+# Version of the data _read_stores_checklist() produces, part of the parquet sidecar name.
+# Bump it whenever the parsing changes (columns, dtypes, cleaning, date handling)
+# so sidecars written by the previous loader are not reused.
+CACHE_VERSION = 1
+
+# Columns read from the "Stores Checklist" sheet (including those that don't need renaming)
+COLUMNS_TO_KEEP = [
+    'Dealership Name',
+    'Go Live Date',
+    'SIM Start Date',
+    'Region',
+    'Implementation Type',
+    'Assignee',
+    'Testing Status'
+]
 
 
 def load_regression_data_from_excel():
@@ -16,6 +37,7 @@ def load_regression_data_from_excel():
     Column Mapping:
     - Dealership Name → Dealership Name
     - Go Live Date → Go Live Date
+    - SIM Start Date → SIM Start Date
     - Days to Go Live → Calculated (Go Live Date - Today, if <0 then "Rolled Out")
     - Region → Region (with "ALL" option)
     - Implementation Type → Implementation Type
@@ -31,17 +53,58 @@ def load_regression_data_from_excel():
     if not excel_path.exists():
         raise FileNotFoundError(f"Excel file not found: {excel_path}")
 
+    # Reuse the parsed sheet if neither the Excel file nor the loader has changed
+    df = read_parquet_cache(excel_path, CACHE_VERSION)
+    if df is None:
+        df = _read_stores_checklist(excel_path)
+        write_parquet_cache(excel_path, df, CACHE_VERSION)
+
+    # Calculate Days to Go Live
+    today = datetime.now()
+    if 'Go Live Date' in df.columns:
+        df['Days to Go Live'] = (df['Go Live Date'] - today).dt.days
+        # If Days to Go Live < 0, mark as "Rolled Out"
+        days = df['Days to Go Live'].astype('Int64')
+        df['Days to Go Live Display'] = np.where(
+            days.lt(0).fillna(False), 'Rolled Out', days.astype(STRING_DTYPE).fillna('')
+        )
+
+    # Handle NA/blank values - replace with pd.NA
+    na_values = ['nan', 'NA', 'N/A', 'na', 'n/a', '', 'None']
+    text_cols = df.select_dtypes(include=['object', 'string']).columns
+    df[text_cols] = df[text_cols].mask(df[text_cols].isin(na_values), pd.NA)
+
+    print(f"[INFO Regression Loader] Final data shape: {df.shape}")
+
+    return df
+
+
+def _read_stores_checklist(excel_path: Path) -> pd.DataFrame:
+    """
+    Parse the "Stores Checklist" sheet of the Regression workbook
+
+    Only covers the steps that depend on the file contents (not on today's
+    date), so the result can be cached until the Excel file changes.
+
+    Args:
+        excel_path: Path to the Excel file
+
+    Returns:
+        pd.DataFrame: Renamed and trimmed sheet data
+    """
     # Read ONLY the "Stores Checklist" sheet
     sheet_name = 'Stores Checklist'
     
-    xl = pd.ExcelFile(excel_path)
-    
-    if sheet_name not in xl.sheet_names:
-        raise ValueError(f"Sheet '{sheet_name}' not found in {excel_path}. Available sheets: {xl.sheet_names}")
+    # Open the workbook once - the sheet check and the read share the parsed file
+    # (calamine engine when installed, pandas' default otherwise)
+    with pd.ExcelFile(excel_path, engine=EXCEL_ENGINE) as xl:
+        if sheet_name not in xl.sheet_names:
+            raise ValueError(f"Sheet '{sheet_name}' not found in {excel_path}. Available sheets: {xl.sheet_names}")
 
-    print(f"[INFO Regression Loader] Reading sheet: '{sheet_name}'")
-    
-    df = pd.read_excel(excel_path, sheet_name=sheet_name)
+        print(f"[INFO Regression Loader] Reading sheet: '{sheet_name}'")
+
+        # Only the needed columns are parsed (headers compared without surrounding whitespace)
+        df = xl.parse(sheet_name, usecols=lambda col: str(col).strip() in COLUMNS_TO_KEEP)
     
     print(f"[INFO Regression Loader] Loaded {len(df)} rows")
 
@@ -53,18 +116,8 @@ def load_regression_data_from_excel():
         'Testing Status': 'Status'
     }
 
-    # Columns to keep (including those that don't need renaming)
-    columns_to_keep = [
-        'Dealership Name',
-        'Go Live Date',
-        'Region',
-        'Implementation Type',
-        'Assignee',
-        'Testing Status'
-    ]
-
-    # Only keep columns that exist
-    existing_cols = [col for col in columns_to_keep if col in df.columns]
+    # Only keep columns that exist (in the documented order)
+    existing_cols = [col for col in COLUMNS_TO_KEEP if col in df.columns]
     df = df[existing_cols]
     
     # Rename columns
@@ -72,30 +125,41 @@ def load_regression_data_from_excel():
 
     print(f"[INFO Regression Loader] Columns after mapping: {df.columns.tolist()}")
 
-    # Standardize values (trim spaces)
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            df[col] = df[col].astype(str).str.strip()
+    # Parse date columns once here. Date-formatted cells already arrive as datetime64;
+    # only columns holding text dates (object dtype) need parsing
+    for col in ['Go Live Date', 'SIM Start Date']:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = _parse_dates(df[col])
 
-    # Convert Go Live Date to datetime
-    if 'Go Live Date' in df.columns:
-        df['Go Live Date'] = pd.to_datetime(df['Go Live Date'], errors='coerce')
+    # Standardize values (trim spaces) - Arrow-backed strings, one pass over the text columns
+    text_cols = df.select_dtypes(include='object').columns
+    df[text_cols] = df[text_cols].apply(lambda col: col.astype(STRING_DTYPE).str.strip())
 
-    # Calculate Days to Go Live
-    today = datetime.now()
-    if 'Go Live Date' in df.columns:
-        df['Days to Go Live'] = (df['Go Live Date'] - today).dt.days
-        # If Days to Go Live < 0, mark as "Rolled Out"
-        df['Days to Go Live Display'] = df['Days to Go Live'].apply(
-            lambda x: 'Rolled Out' if pd.notna(x) and x < 0 else (str(int(x)) if pd.notna(x) else '')
-        )
+    return df
 
-    # Handle NA/blank values - replace with pd.NA
-    na_values = ['nan', 'NA', 'N/A', 'na', 'n/a', '', 'None']
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            df[col] = df[col].replace(na_values, pd.NA)
 
-    print(f"[INFO Regression Loader] Final data shape: {df.shape}")
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of Excel dates that came back as object dtype
 
-    return df
+    Datetime cells and ISO text dates go through the fixed-format parser
+    (cache=True reuses the parse for repeated strings); only the leftovers
+    text in other layouts falls back to per-value format detection.
+
+    Args:
+        values: Column of datetime objects and/or date strings
+
+    Returns:
+        pd.Series: datetime64 column (NaT where the value is not a date)
+    """
+    parsed = pd.to_datetime(values, format=DATE_FORMAT, errors='coerce', cache=True)
+
+    # Only text can be in another layout; numbers and other leftovers stay NaT.
+    # The fallback is cast to the first parse's unit and merged with fillna, so
+    # no in-place assignment mixes datetime64 units (pandas 3 rejects that).
+    leftovers = parsed.isna() & values.map(lambda v: isinstance(v, str))
+    if leftovers.any():
+        fallback = pd.to_datetime(values.where(leftovers), format='mixed', errors='coerce')
+        parsed = parsed.fillna(fallback.astype(parsed.dtype))
+
+    return parsed
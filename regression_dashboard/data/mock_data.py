@@ -4,8 +4,6 @@ Regression Testing Dashboard - Mock Data Generator
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
 
 
 def generate_mock_data(num_rows: int = 50) -> pd.DataFrame:
@@ -19,9 +17,7 @@ def generate_mock_data(num_rows: int = 50) -> pd.DataFrame:
         pd.DataFrame: Mock data
     """
     
-    # Set random seed for reproducibility
-    np.random.seed(42)
-    random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Sample data
     dealership_names = [
@@ -37,61 +33,44 @@ def generate_mock_data(num_rows: int = 50) -> pd.DataFrame:
     
     implementation_types = ['Conquest', 'Buy/Sell', 'Enterprise', 'New Point']
     
-    testing_statuses = ['Completed', 'WIP', 'Unable to Complete', None, '']
-    
     assignees = [
         'John Doe', 'Jane Smith', 'Bob Johnson', 'Alice Williams',
         'Charlie Brown', 'Diana Prince', 'Eve Davis', 'Frank Miller',
         'Grace Lee', 'Henry Wilson', 'Ivy Chen', 'Jack Taylor'
     ]
     
-    # Generate data
-    data = []
-    today = datetime.now()
+    # Generate data - one vectorized draw per column
+    n = num_rows
+    today = pd.Timestamp.now()
     
-    for i in range(num_rows):
-        # Generate Go Live Date (spread across past, current, and future months)
-        days_offset = random.randint(-90, 90)  # -90 to +90 days from today
-        go_live_date = today + timedelta(days=days_offset)
-        
-        # Generate SIM Start Date (usually before Go Live Date)
-        sim_days_before = random.randint(7, 30)  # 7-30 days before Go Live
-        sim_start_date = go_live_date - timedelta(days=sim_days_before)
-        
-        # Determine status based on SIM Start Date
-        if sim_start_date < today:
-            # Past SIM Start Date
-            if random.random() < 0.7:  # 70% have status
-                status = random.choice(['Completed', 'WIP', 'Unable to Complete'])
-            else:  # 30% are blank (Data Incomplete)
-                status = random.choice([None, ''])
-        else:
-            # Future SIM Start Date
-            if random.random() < 0.3:  # 30% have status
-                status = random.choice(['Completed', 'WIP'])
-            else:  # 70% are blank
-                status = random.choice([None, ''])
-        
-        # Generate dealer ID
-        dealer_id = f"{10000 + i}"
-        
-        row = {
-            'Dealership Name': f"{random.choice(dealership_names)} - {dealer_id}",
-            'Go-Live Date': go_live_date,
-            'SIM Start Date': sim_start_date,
-            'Assignee': random.choice(assignees),
-            'Region': random.choice(regions),
-            'Testing Status': status,
-            'Type of Implementation': random.choice(implementation_types)
-        }
-        
-        data.append(row)
+    # Go Live Date spread across past, current, and future months (-90 to +90 days from today)
+    go_live_dates = today + pd.to_timedelta(rng.integers(-90, 91, n), unit='D')
+    
+    # SIM Start Date usually 7-30 days before Go Live
+    sim_start_dates = go_live_dates - pd.to_timedelta(rng.integers(7, 31, n), unit='D')
     
-    df = pd.DataFrame(data)
+    # Status depends on SIM Start Date:
+    # past SIM start - 70% have a status (any of the three), 30% blank (Data Incomplete)
+    # future SIM start - 30% have a status (Completed or WIP), 70% blank
+    is_past = np.asarray(sim_start_dates < today)
+    has_status = np.where(is_past, rng.random(n) < 0.7, rng.random(n) < 0.3)
+    status_choices = np.array(['Completed', 'WIP', 'Unable to Complete'], dtype=object)
+    statuses = np.where(
+        is_past,
+        status_choices[rng.integers(0, 3, n)],
+        status_choices[rng.integers(0, 2, n)]
+    )
+    blanks = np.array([None, ''], dtype=object)[rng.integers(0, 2, n)]
     
-    # Convert date columns to datetime
-    df['Go-Live Date'] = pd.to_datetime(df['Go-Live Date'])
-    df['SIM Start Date'] = pd.to_datetime(df['SIM Start Date'])
+    df = pd.DataFrame({
+        'Dealership Name': [f"{name} - {10000 + i}" for i, name in enumerate(rng.choice(dealership_names, n))],
+        'Go-Live Date': go_live_dates,
+        'SIM Start Date': sim_start_dates,
+        'Assignee': rng.choice(assignees, n),
+        'Region': rng.choice(regions, n),
+        'Testing Status': np.where(has_status, statuses, blanks),
+        'Type of Implementation': rng.choice(implementation_types, n)
+    })
     
     print(f"[DEBUG Mock Data] Generated {len(df)} rows")
     print(f"[DEBUG Mock Data] Columns: {df.columns.tolist()}")
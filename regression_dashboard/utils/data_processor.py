@@ -6,7 +6,52 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
-from shared.column_utils import find_column, has_column
+from regression_dashboard.config.settings import DEBUG
+from shared.column_utils import normalize_regions, STRING_DTYPE
+
+# Numba is optional (see requirements.txt) - without it the SIM window masks are built with
+# pandas comparisons only
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Below this many rows the pandas comparisons are faster than a parallel kernel launch
+SIM_KERNEL_MIN_ROWS = 100_000
+
+# int64 value of NaT in a datetime64 array viewed as integers
+NAT_INT64 = np.iinfo(np.int64).min
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _sim_window_kernel(sim_start, status_blank, today, next_week):
+        """
+        Build the Upcoming Next Week and Data Incomplete masks in one fused pass
+
+        Args:
+            sim_start: int64 array of SIM Start Date nanoseconds (NAT_INT64 when missing)
+            status_blank: bool array, True where Status is missing or blank
+            today: today's date in nanoseconds
+            next_week: today + 7 days in nanoseconds
+
+        Returns:
+            tuple: (upcoming, incomplete) bool arrays
+        """
+        n = sim_start.shape[0]
+        upcoming = np.zeros(n, dtype=np.bool_)
+        incomplete = np.zeros(n, dtype=np.bool_)
+
+        for i in prange(n):
+            start = sim_start[i]
+            if start == NAT_INT64:
+                continue
+            upcoming[i] = today <= start <= next_week
+            incomplete[i] = start < today and status_blank[i]
+
+        return upcoming, incomplete
 
 
 class RegressionDataProcessor:
@@ -19,14 +64,45 @@ class RegressionDataProcessor:
         Args:
             df: Raw DataFrame from data source
         """
-        self.df = df.copy()
+        # Reference dates are fixed for the processor's lifetime (the cached processor expires after 5 minutes)
+        self.today = pd.Timestamp.now().normalize()
+        self.next_week = self.today + pd.Timedelta(days=7)
+
+        # Shallow copy: _prepare_data replaces whole columns, so the caller's buffers are never written
+        self.df = df.copy(deep=False)
         self._prepare_data()
+
+        # Full-dataset regions, computed once
+        self.all_regions = self.get_regions(self.df)
+
+        # KPI subsets that don't depend on UI filters - computed once instead of on every rerun
+        upcoming_mask, incomplete_mask = self._sim_window_masks()
+        self.upcoming_df = self.df[upcoming_mask]
+        self.incomplete_df = self.df[incomplete_mask]
+
+        # Results per month key - the cached processor outlives reruns, so each month is filtered
+        # and counted once
+        self._date_filter_cache = {}
+        self._month_kpis = {}
+
+        # Row positions per Go Live month, built in one groupby pass - month tabs reuse them
+        self._month_positions = self.df.groupby('Go Live Month').indices
+
+        # Implementation type column (the Excel sheet and mock data name it differently)
+        # and its row positions per type, for the unfiltered-data fast path
+        self._impl_col = next(
+            (col for col in ['Implementation Type', 'Type of Implementation'] if col in self.df.columns),
+            None
+        )
+        self._impl_positions = (
+            self.df.groupby(self._impl_col, observed=True).indices if self._impl_col else {}
+        )
     
     def _prepare_data(self):
         """Prepare and clean data"""
 
-        # Print available columns for debugging
-        print(f"[DEBUG Regression Processor] Available columns: {self.df.columns.tolist()}")
+        if DEBUG:
+            print(f"[DEBUG Regression Processor] Available columns: {self.df.columns.tolist()}")
 
         # Rename columns to standard names
         column_mapping = {
@@ -45,27 +121,76 @@ class RegressionDataProcessor:
             'Region': ''
         }
 
-        for col, default_val in required_cols.items():
-            if col not in self.df.columns:
-                print(f"[WARNING] Column '{col}' not found, adding with default value")
-                self.df[col] = default_val
+        missing_cols = {col: default_val for col, default_val in required_cols.items() if col not in self.df.columns}
+        for col in missing_cols:
+            print(f"[WARNING] Column '{col}' not found, adding with default value")
+        if missing_cols:
+            # Insert all missing columns in one operation instead of one block insert each
+            self.df = self.df.assign(**missing_cols)
 
-        # Ensure date columns are datetime
-        self.df['Go Live Date'] = pd.to_datetime(self.df['Go Live Date'], errors='coerce')
-        self.df['SIM Start Date'] = pd.to_datetime(self.df['SIM Start Date'], errors='coerce')
+        # Ensure date columns are datetime (the Excel loader and mock data already deliver datetimes)
+        for col in ['Go Live Date', 'SIM Start Date']:
+            if not pd.api.types.is_datetime64_any_dtype(self.df[col]):
+                self.df[col] = pd.to_datetime(self.df[col], errors='coerce')
 
         # Add Month and Year columns for filtering
-        self.df['Go Live Month'] = self.df['Go Live Date'].dt.month
-        self.df['Go Live Year'] = self.df['Go Live Date'].dt.year
+        # (nullable int16: stays integer when dates are missing instead of falling back to float64)
+        self.df['Go Live Month'] = self.df['Go Live Date'].dt.month.astype('Int16')
+        self.df['Go Live Year'] = self.df['Go Live Date'].dt.year.astype('Int16')
 
         # Clean Status column (handle None, NaN, empty strings)
-        self.df['Status'] = self.df['Status'].fillna('').astype(str).str.strip()
-        self.df.loc[self.df['Status'] == '', 'Status'] = None
+        # - one strip pass on Arrow-backed strings, blanks become missing
+        self.df['Status'] = self.df['Status'].astype(STRING_DTYPE).str.strip().replace('', pd.NA)
 
-        print(f"[DEBUG Regression Processor] Data prepared: {len(self.df)} records")
-        print(f"[DEBUG Regression Processor] Final columns: {self.df.columns.tolist()}")
-        print(f"[DEBUG Regression Processor] Status distribution:\n{self.df['Status'].value_counts(dropna=False)}")
+        # Normalize regions once to their canonical names (e.g. "usa east " -> "USA East") so filters
+        # match the region buttons; missing regions stay missing instead of becoming the text 'Nan'
+        self.df['Region'] = normalize_regions(self.df['Region'])
+
+        # Low-cardinality columns as categoricals: equality filters become integer compares
+        for col in ['Region', 'Status', 'Implementation Type', 'Type of Implementation']:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype('category')
+
+        if DEBUG:
+            print(f"[DEBUG Regression Processor] Data prepared: {len(self.df)} records")
+            print(f"[DEBUG Regression Processor] Final columns: {self.df.columns.tolist()}")
+            print(f"[DEBUG Regression Processor] Status distribution:\n{self.df['Status'].value_counts(dropna=False)}")
     
+    def _sim_window_masks(self):
+        """
+        Masks for Upcoming Next Week (SIM Start Date within next 7 days) and
+        Data Incomplete (SIM Start Date before today but Status is blank)
+
+        Large sheets use the fused Numba kernel when Numba is installed.
+
+        Returns:
+            tuple: (upcoming, incomplete) boolean arrays aligned with self.df
+        """
+        sim_start = self.df['SIM Start Date']
+        status_blank = self._blank_status_mask(self.df)
+
+        if NUMBA_AVAILABLE and len(self.df) >= SIM_KERNEL_MIN_ROWS:
+            return _sim_window_kernel(
+                sim_start.to_numpy(dtype='datetime64[ns]').view(np.int64),
+                status_blank.to_numpy(dtype=np.bool_),
+                self.today.value,
+                self.next_week.value
+            )
+
+        upcoming = (sim_start >= self.today) & (sim_start <= self.next_week)
+        incomplete = (sim_start < self.today) & status_blank
+        return upcoming.to_numpy(), incomplete.to_numpy()
+
+    @staticmethod
+    def _blank_status_mask(df: pd.DataFrame) -> pd.Series:
+        """Boolean mask of rows whose Status is missing or blank"""
+        status = df['Status']
+        if isinstance(status.dtype, pd.CategoricalDtype):
+            # _prepare_data turns blank statuses into missing ones, so a single
+            # missing-code check covers both
+            return status.isna()
+        return status.isna() | (status == '')
+
     def filter_by_date_range(self, filter_type: str) -> pd.DataFrame:
         """
         Filter data by month name (dynamically handles all 12 months)
@@ -74,11 +199,15 @@ class RegressionDataProcessor:
             filter_type: lowercase month name ('january', 'february', etc.) or 'ytd'
 
         Returns:
-            Filtered DataFrame
+            Filtered DataFrame (cached per filter type, a view of the processor data - do not modify in place)
         """
+        cache_key = filter_type.lower()
+        if cache_key in self._date_filter_cache:
+            return self._date_filter_cache[cache_key]
+
         if filter_type == 'ytd':
             # YTD: All data (entire dataset)
-            filtered = self.df.copy()
+            filtered = self.df
         else:
             # Map month names to numbers
             month_map = {
@@ -90,13 +219,15 @@ class RegressionDataProcessor:
             if filter_type.lower() in month_map:
                 month_num = month_map[filter_type.lower()]
                 # Filter by month (any year in the data)
-                mask = self.df['Go Live Month'] == month_num
-                filtered = self.df[mask].copy()
+                positions = self._month_positions.get(month_num, [])
+                filtered = self.df.iloc[positions]
             else:
                 # Unknown filter, return all data
-                filtered = self.df.copy()
+                filtered = self.df
 
-        print(f"[DEBUG Regression Processor] Filtered by {filter_type}: {len(filtered)} records")
+        if DEBUG:
+            print(f"[DEBUG Regression Processor] Filtered by {filter_type}: {len(filtered)} records")
+        self._date_filter_cache[cache_key] = filtered
         return filtered
     
     def get_kpis(self, df: pd.DataFrame) -> Dict[str, int]:
@@ -109,34 +240,43 @@ class RegressionDataProcessor:
         Returns:
             Dictionary of KPI name to count
         """
-        today = pd.Timestamp.now().normalize()
-        next_week = today + pd.Timedelta(days=7)
-        
-        # Calculate Upcoming Next Week (SIM Start Date within next 7 days)
-        upcoming_next_week_count = len(self.df[
-            (self.df['SIM Start Date'] >= today) &
-            (self.df['SIM Start Date'] <= next_week)
-        ])
-        
-        # Calculate Data Incomplete (SIM Start Date before today but Status is blank)
-        data_incomplete_count = len(self.df[
-            (self.df['SIM Start Date'] < today) &
-            (self.df['Status'].isna() | (self.df['Status'] == ''))
-        ])
+        # Upcoming Next Week (SIM Start Date within next 7 days) and
+        # Data Incomplete (SIM Start Date before today but Status is blank) are precomputed
+        upcoming_next_week_count = len(self.upcoming_df)
+        data_incomplete_count = len(self.incomplete_df)
         
+        # Count all statuses in one pass
+        status_counts = df['Status'].value_counts()
+
         kpis = {
             'Total Go Live': len(df),
-            'Completed': len(df[df['Status'] == 'Completed']),
-            'WIP': len(df[df['Status'] == 'WIP']),
-            'Unable to Complete': len(df[df['Status'] == 'Unable to Complete']),
+            'Completed': int(status_counts.get('Completed', 0)),
+            'WIP': int(status_counts.get('WIP', 0)),
+            'Unable to Complete': int(status_counts.get('Unable to Complete', 0)),
             'Upcoming Next Week': upcoming_next_week_count,
             'Data Incomplete': data_incomplete_count
         }
         
-        print(f"[DEBUG Regression Processor] KPIs: {kpis}")
+        if DEBUG:
+            print(f"[DEBUG Regression Processor] KPIs: {kpis}")
         
         return kpis
     
+    def get_month_kpis(self, month_key: str, df: pd.DataFrame) -> Dict[str, int]:
+        """
+        Get KPIs for a month tab, calculating them only the first time
+
+        Args:
+            month_key: Month key the data was filtered by ('january', ..., 'ytd')
+            df: Data filtered by filter_by_date_range(month_key)
+
+        Returns:
+            Dictionary of KPI name to count
+        """
+        if month_key not in self._month_kpis:
+            self._month_kpis[month_key] = self.get_kpis(df)
+        return dict(self._month_kpis[month_key])
+
     def filter_by_implementation_type(self, impl_type: str, df: pd.DataFrame) -> pd.DataFrame:
         """
         Filter data by implementation type
@@ -146,49 +286,104 @@ class RegressionDataProcessor:
             df: DataFrame to filter
 
         Returns:
-            Filtered DataFrame
+            Filtered DataFrame (may be a view of the input - do not modify in place)
         """
         if impl_type == 'All':
-            return df.copy()
+            return df
         else:
-            # Use the correct column name: 'Implementation Type' (not 'Type of Implementation')
-            impl_col = find_column(df, ['Implementation Type', 'Type of Implementation'])
+            impl_col = self._impl_col
             if impl_col:
-                filtered = df[df[impl_col] == impl_type].copy()
-                print(f"[DEBUG Regression Processor] Filtered by {impl_type}: {len(filtered)} records")
+                if df is self.df:
+                    # Full dataset: take the precomputed row positions
+                    filtered = self.df.iloc[self._impl_positions.get(impl_type, [])]
+                else:
+                    filtered = df[df[impl_col] == impl_type]
+                if DEBUG:
+                    print(f"[DEBUG Regression Processor] Filtered by {impl_type}: {len(filtered)} records")
                 return filtered
             else:
                 print(f"[WARNING Regression Processor] Implementation Type column not found")
-                return df.copy()
+                return df
     
+    def filter_by_kpi(self, kpi_name: str, impl_type: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Get the rows behind a KPI card, filtered by implementation type
+
+        Upcoming Next Week and Data Incomplete use the precomputed full-dataset
+        subsets; every other KPI filters the given (month-filtered) data.
+
+        Args:
+            kpi_name: KPI name ('Total Go Live', a Status value, 'Upcoming Next Week' or 'Data Incomplete')
+            impl_type: Implementation type or 'All'
+            df: Month-filtered DataFrame
+
+        Returns:
+            Filtered DataFrame
+        """
+        if kpi_name == 'Upcoming Next Week':
+            base_df = self.upcoming_df
+        elif kpi_name == 'Data Incomplete':
+            base_df = self.incomplete_df
+        else:
+            base_df = df
+
+        kpi_df = self.filter_by_implementation_type(impl_type, base_df)
+
+        if kpi_name not in ('Total Go Live', 'Upcoming Next Week', 'Data Incomplete'):
+            kpi_df = kpi_df[kpi_df['Status'] == kpi_name]
+
+        return kpi_df
+
     def get_regions(self, df: Optional[pd.DataFrame] = None) -> List[str]:
         """Get unique regions from data"""
-        if df is None:
+        if df is None or df is self.df:
+            # Full-dataset regions are computed once in __init__
+            if hasattr(self, 'all_regions'):
+                return list(self.all_regions)
             df = self.df
 
         # Safety check: ensure Region column exists
         if 'Region' not in df.columns:
-            print("[DEBUG Regression] 'Region' column missing in DataFrame!")
+            if DEBUG:
+                print("[DEBUG Regression] 'Region' column missing in DataFrame!")
             return ['All']
 
-        # Normalize regions: strip whitespace, title case
-        df['Region'] = df['Region'].astype(str).str.strip().str.title()
-        
+        # Regions are normalized in _prepare_data
         # Get unique regions, excluding NaN and empty values
-        regions = [r for r in df['Region'].unique() if r and r != 'Nan']
+        if df is self.df and isinstance(df['Region'].dtype, pd.CategoricalDtype):
+            # Categories are built from the data and never include missing values
+            region_values = df['Region'].cat.categories
+        else:
+            region_values = df['Region'].dropna().unique()
+        regions = [r for r in region_values if r]
         
         # If no regions found, return default
         if not regions:
-            print("[DEBUG Regression] No regions found, returning default")
+            if DEBUG:
+                print("[DEBUG Regression] No regions found, returning default")
             return ['All']
 
         # Sort regions alphabetically, then add 'All' at the beginning
         sorted_regions = sorted(regions)
         region_options = ['All'] + sorted_regions
         
-        print(f"[DEBUG Regression] Regions extracted: {region_options}")
+        if DEBUG:
+            print(f"[DEBUG Regression] Regions extracted: {region_options}")
         return region_options
 
+    def region_counts(self, df: pd.DataFrame) -> Dict[str, int]:
+        """
+        Count rows per region in a single groupby pass
+
+        Args:
+            df: DataFrame to count
+
+        Returns:
+            Dictionary of region to row count (every region in the dataset, zero if absent)
+        """
+        counts = df.groupby('Region', sort=False, observed=True).size()
+        return counts.reindex(self.all_regions, fill_value=0).to_dict()
+
     def get_region_counts(self, kpi_name: str, df: pd.DataFrame) -> Dict[str, int]:
         """
         Get counts by region for a specific KPI
@@ -200,35 +395,11 @@ class RegressionDataProcessor:
         Returns:
             Dictionary of region to count
         """
-        regions = self.get_regions(df)
-        region_counts = {}
-        
-        today = pd.Timestamp.now().normalize()
-        next_week = today + pd.Timedelta(days=7)
-        
-        for region in regions:
-            region_df = df[df['Region'] == region]
-            
-            if kpi_name == 'Total Go Live':
-                count = len(region_df)
-            elif kpi_name == 'Upcoming Next Week':
-                count = len(self.df[
-                    (self.df['Region'] == region) &
-                    (self.df['SIM Start Date'] >= today) &
-                    (self.df['SIM Start Date'] <= next_week)
-                ])
-            elif kpi_name == 'Data Incomplete':
-                count = len(self.df[
-                    (self.df['Region'] == region) &
-                    (self.df['SIM Start Date'] < today) &
-                    (self.df['Status'].isna() | (self.df['Status'] == ''))
-                ])
-            else:
-                count = len(region_df[region_df['Status'] == kpi_name])
-            
-            region_counts[region] = count
-        
-        return region_counts
+        # Rows behind the KPI (any implementation type), counted per region in one groupby pass
+        kpi_df = self.filter_by_kpi(kpi_name, 'All', df)
+        counts = kpi_df.groupby('Region', sort=False, observed=True).size()
+
+        return counts.reindex(self.get_regions(df), fill_value=0).to_dict()
     
     def filter_by_region(self, region: str, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -239,13 +410,14 @@ class RegressionDataProcessor:
             df: DataFrame to filter
             
         Returns:
-            Filtered DataFrame
+            Filtered DataFrame (may be a view of the input - do not modify in place)
         """
         if region == 'All' or region == 'All Regions':
-            return df.copy()
+            return df
         else:
-            filtered = df[df['Region'] == region].copy()
-            print(f"[DEBUG Regression Processor] Filtered by region {region}: {len(filtered)} records")
+            filtered = df[df['Region'] == region]
+            if DEBUG:
+                print(f"[DEBUG Regression Processor] Filtered by region {region}: {len(filtered)} records")
             return filtered
     
     def get_display_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -259,10 +431,12 @@ class RegressionDataProcessor:
             Display-ready DataFrame
         """
         # Check if Days to Go Live Display exists, otherwise create it
+        # (on a new frame - df may be a view of the processor data)
         if 'Days to Go Live Display' not in df.columns and 'Days to Go Live' in df.columns:
-            df['Days to Go Live Display'] = df['Days to Go Live'].apply(
-                lambda x: 'Rolled Out' if pd.notna(x) and x < 0 else (str(int(x)) if pd.notna(x) else '')
-            )
+            days = pd.to_numeric(df['Days to Go Live'], errors='coerce').astype('Int64')
+            df = df.assign(**{'Days to Go Live Display': np.where(
+                days.lt(0).fillna(False), 'Rolled Out', days.astype('string').fillna('')
+            )})
 
         display_df = df[[
             'Dealership Name',
@@ -273,16 +447,21 @@ class RegressionDataProcessor:
             'Status'
         ]].copy()
 
-        # Format dates
-        display_df['Go Live Date'] = pd.to_datetime(display_df['Go Live Date']).dt.strftime('%d-%b-%Y')
+        # Format dates - _prepare_data guarantees datetime64, and each distinct date is
+        # formatted once as a DatetimeIndex batch, then spread back to the rows
+        # (code -1, a missing date, picks the appended NaN)
+        codes, unique_dates = pd.factorize(display_df['Go Live Date'])
+        formatted = np.append(unique_dates.strftime('%d-%b-%Y').to_numpy(dtype=object), np.nan)
+        display_df['Go Live Date'] = formatted[codes]
 
         # Rename for display
         display_df = display_df.rename(columns={'Days to Go Live Display': 'Days to Go Live'})
         
         # Replace None/NaN in Status with empty string
-        display_df['Status'] = display_df['Status'].fillna('')
+        display_df['Status'] = display_df['Status'].astype(object).fillna('')
         
-        print(f"[DEBUG Regression Processor] Display DataFrame ready: {len(display_df)} records")
+        if DEBUG:
+            print(f"[DEBUG Regression Processor] Display DataFrame ready: {len(display_df)} records")
         
         return display_df
 
@@ -6,18 +6,19 @@ Allows Super Admins to add/remove regular admins
 import streamlit as st
 import json
 import os
+import pandas as pd
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from shared.auth import (
     validate_email, 
     is_current_user_super_admin,
+    is_super_admin,
     REQUIRED_DOMAIN,
-    SUPER_ADMIN_EMAILS
+    SUPER_ADMIN_EMAILS,
+    ADMIN_LIST_FILE,
+    read_admin_file
 )
 
-# File to store admin list
-ADMIN_LIST_FILE = "data/admin_list.json"
-
 # ============================================================================
 # ADMIN LIST MANAGEMENT
 # ============================================================================
@@ -27,22 +28,23 @@ def load_admin_list() -> List[str]:
     Load admin list from file
     
     Returns:
-        List of admin email addresses
+        List of admin email addresses (lowercase)
     """
-    if not os.path.exists(ADMIN_LIST_FILE):
-        # Create default file
-        os.makedirs(os.path.dirname(ADMIN_LIST_FILE), exist_ok=True)
-        save_admin_list([])
-        return []
-    
     try:
-        with open(ADMIN_LIST_FILE, 'r') as f:
-            data = json.load(f)
-            return data.get('admins', [])
+        data = read_admin_file()
     except Exception as e:
         st.error(f"Error loading admin list: {str(e)}")
         return []
 
+    if data is None:
+        # Create default file
+        os.makedirs(os.path.dirname(ADMIN_LIST_FILE), exist_ok=True)
+        save_admin_list([])
+        return []
+
+    # Lowercased copy: callers compare against lowercase emails and append to / filter the list
+    return [admin.lower() for admin in data.get('admins', [])]
+
 
 def save_admin_list(admins: List[str]) -> bool:
     """
@@ -63,8 +65,13 @@ def save_admin_list(admins: List[str]) -> bool:
             'updated_by': st.session_state.get('user_email', 'unknown')
         }
         
-        with open(ADMIN_LIST_FILE, 'w') as f:
+        # Write a temp file and swap it in, so a failed write never leaves a truncated admin list
+        tmp_file = f"{ADMIN_LIST_FILE}.tmp"
+        with open(tmp_file, 'w') as f:
             json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, ADMIN_LIST_FILE)
         
         return True
     except Exception as e:
@@ -72,16 +79,21 @@ def save_admin_list(admins: List[str]) -> bool:
         return False
 
 
-def get_all_admins() -> List[str]:
+def get_all_admins(regular_admins: Optional[List[str]] = None) -> List[str]:
     """
     Get all admins (regular + super admins)
     
+    Args:
+        regular_admins: Regular admin list if already loaded (loaded from file otherwise)
+    
     Returns:
         List of all admin emails
     """
-    regular_admins = load_admin_list()
-    all_admins = list(set(regular_admins + SUPER_ADMIN_EMAILS))
-    return sorted(all_admins)
+    if regular_admins is None:
+        regular_admins = load_admin_list()
+    # load_admin_list returns lowercase emails, so the union drops case duplicates too
+    super_admins = {admin.lower() for admin in SUPER_ADMIN_EMAILS}
+    return sorted(super_admins.union(regular_admins))
 
 
 def add_admin(email: str) -> Tuple[bool, str]:
@@ -102,14 +114,14 @@ def add_admin(email: str) -> Tuple[bool, str]:
     email_lower = email.lower()
     
     # Check if already super admin
-    if email_lower in [sa.lower() for sa in SUPER_ADMIN_EMAILS]:
+    if is_super_admin(email_lower):
         return False, "This email is already a Super Admin"
     
     # Load current admin list
     admins = load_admin_list()
     
     # Check if already admin
-    if email_lower in [a.lower() for a in admins]:
+    if email_lower in admins:
         return False, "This email is already an Admin"
     
     # Add to list
@@ -135,18 +147,18 @@ def remove_admin(email: str) -> Tuple[bool, str]:
     email_lower = email.lower()
     
     # Cannot remove super admins
-    if email_lower in [sa.lower() for sa in SUPER_ADMIN_EMAILS]:
+    if is_super_admin(email_lower):
         return False, "Cannot remove Super Admins"
     
     # Load current admin list
     admins = load_admin_list()
     
     # Check if admin exists
-    if email_lower not in [a.lower() for a in admins]:
+    if email_lower not in admins:
         return False, "This email is not in the admin list"
     
     # Remove from list
-    admins = [a for a in admins if a.lower() != email_lower]
+    admins = [a for a in admins if a != email_lower]
     
     # Save
     if save_admin_list(admins):
@@ -172,32 +184,22 @@ def render_super_admin_panel():
     st.markdown("### Manage Admin Users")
     
     # Get current admin list
-    all_admins = get_all_admins()
     regular_admins = load_admin_list()
+    all_admins = get_all_admins(regular_admins)
     
     # Display current admins
     st.markdown("#### Current Admins")
     
     if all_admins:
-        # Create a nice table
-        admin_data = []
-        for admin_email in all_admins:
-            if admin_email.lower() in [sa.lower() for sa in SUPER_ADMIN_EMAILS]:
-                role = "⭐ Super Admin"
-                can_remove = False
-            else:
-                role = "🔧 Admin"
-                can_remove = True
-            
-            admin_data.append({
-                "Email": admin_email,
-                "Role": role,
-                "Can Remove": "✅" if can_remove else "❌"
-            })
+        # Create a nice table, built column-wise in one DataFrame constructor
+        super_admin_flags = [is_super_admin(admin_email) for admin_email in all_admins]
         
         # Display as table
-        import pandas as pd
-        df = pd.DataFrame(admin_data)
+        df = pd.DataFrame({
+            "Email": all_admins,
+            "Role": ["⭐ Super Admin" if is_sa else "🔧 Admin" for is_sa in super_admin_flags],
+            "Can Remove": ["❌" if is_sa else "✅" for is_sa in super_admin_flags]
+        })
         st.dataframe(df, use_container_width=True, hide_index=True)
         
         st.info(f"📊 Total: {len(all_admins)} admins ({len(SUPER_ADMIN_EMAILS)} Super Admins, {len(regular_admins)} Regular Admins)")
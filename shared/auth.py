@@ -4,6 +4,7 @@ Handles user authentication and admin access control
 """
 
 import streamlit as st
+from functools import lru_cache
 from typing import Optional, Tuple
 import re
 import json
@@ -29,6 +30,9 @@ SUPER_ADMIN_EMAILS = [
     # "superadmin3@tekion.com",
 ]
 
+# Lowercased once for O(1) membership checks
+_SUPER_ADMIN_SET = frozenset(admin.lower() for admin in SUPER_ADMIN_EMAILS)
+
 # Regular Admin emails (can upload/refresh data but cannot manage other admins)
 # This list will be stored in a file and managed by Super Admins
 ADMIN_EMAILS = [
@@ -41,13 +45,25 @@ ADMIN_EMAILS = [
 # Required email domain for all users
 REQUIRED_DOMAIN = "@tekion.com"
 
+# Compiled once - validate_email runs on every login and admin add
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_REQUIRED_DOMAIN_LOWER = REQUIRED_DOMAIN.lower()
+
+# File storing the regular admins managed by Super Admins
+ADMIN_LIST_FILE = "data/admin_list.json"
+
+# Parsed admin file keyed by its (inode, mtime_ns, size) - is_admin runs on every rerun
+_admin_file_cache = (None, {})
+
 # ============================================================================
 # AUTHENTICATION FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=256)
 def validate_email(email: str) -> Tuple[bool, str]:
     """
     Validate email format and domain
+    Results are cached - the check depends only on the email and module constants
     
     Args:
         email: Email address to validate
@@ -59,12 +75,11 @@ def validate_email(email: str) -> Tuple[bool, str]:
         return False, "Email cannot be empty"
     
     # Basic email format validation
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(email_pattern, email):
+    if not _EMAIL_PATTERN.match(email):
         return False, "Invalid email format"
     
     # Check domain
-    if not email.lower().endswith(REQUIRED_DOMAIN.lower()):
+    if not email.lower().endswith(_REQUIRED_DOMAIN_LOWER):
         return False, f"Only {REQUIRED_DOMAIN} emails are allowed"
     
     return True, ""
@@ -80,22 +95,51 @@ def is_super_admin(email: str) -> bool:
     Returns:
         bool: True if user is super admin, False otherwise
     """
-    return email.lower() in [admin.lower() for admin in SUPER_ADMIN_EMAILS]
+    return email.lower() in _SUPER_ADMIN_SET
+
+
+def read_admin_file() -> Optional[dict]:
+    """
+    Read the admin list file, re-parsing it only when the file changes
+
+    Returns:
+        dict: Parsed file contents, or None if the file doesn't exist.
+            The dict is shared between calls - copy before modifying.
+
+    Raises:
+        OSError, ValueError: If the file can't be read or parsed
+    """
+    global _admin_file_cache
+
+    try:
+        stat = os.stat(ADMIN_LIST_FILE)
+    except FileNotFoundError:
+        return None
+
+    file_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached_key, cached_data = _admin_file_cache
+    if file_key == cached_key:
+        return cached_data
+
+    with open(ADMIN_LIST_FILE, 'r') as f:
+        data = json.load(f)
+    _admin_file_cache = (file_key, data)
+    return data
 
 
 def _load_admin_list_from_file() -> list:
     """Load admin list from file"""
-    admin_file = "data/admin_list.json"
-    if not os.path.exists(admin_file):
-        return ADMIN_EMAILS  # Return hardcoded list if file doesn't exist
-    
     try:
-        with open(admin_file, 'r') as f:
-            data = json.load(f)
-            return data.get('admins', ADMIN_EMAILS)
-    except:
+        data = read_admin_file()
+    except (OSError, ValueError) as e:
+        # Unreadable or malformed file (json.JSONDecodeError is a ValueError)
+        print(f"[WARNING Auth] Could not read {ADMIN_LIST_FILE}: {e}")
         return ADMIN_EMAILS
 
+    if data is None:
+        return ADMIN_EMAILS  # Return hardcoded list if file doesn't exist
+    return list(data.get('admins', ADMIN_EMAILS))
+
 
 def is_admin(email: str) -> bool:
     """
@@ -109,11 +153,14 @@ def is_admin(email: str) -> bool:
     """
     email_lower = email.lower()
     
+    # Super admins are always admins - no need to touch the admin file
+    if email_lower in _SUPER_ADMIN_SET:
+        return True
+    
     # Load dynamic admin list from file
     dynamic_admins = _load_admin_list_from_file()
     
-    return (email_lower in [admin.lower() for admin in dynamic_admins] or 
-            email_lower in [admin.lower() for admin in SUPER_ADMIN_EMAILS])
+    return any(admin.lower() == email_lower for admin in dynamic_admins)
 
 
 def authenticate_user() -> Optional[str]:
@@ -156,13 +203,16 @@ def authenticate_user() -> Optional[str]:
                     st.rerun()
                 else:
                     # No verification needed - login directly
+                    # Super admins are always admins, so is_admin only runs for everyone else
+                    user_is_super_admin = is_super_admin(email)
+                    user_is_admin = user_is_super_admin or is_admin(email)
                     st.session_state.user_email = email.lower()
-                    st.session_state.is_admin = is_admin(email)
-                    st.session_state.is_super_admin = is_super_admin(email)
+                    st.session_state.is_admin = user_is_admin
+                    st.session_state.is_super_admin = user_is_super_admin
                     
-                    if is_super_admin(email):
+                    if user_is_super_admin:
                         st.success(f"✅ Welcome, Super Admin {email}!")
-                    elif is_admin(email):
+                    elif user_is_admin:
                         st.success(f"✅ Welcome, Admin {email}!")
                     else:
                         st.success(f"✅ Welcome, {email}!")
@@ -177,14 +227,16 @@ def authenticate_user() -> Optional[str]:
         
         if render_email_verification_ui(pending_email):
             # Email verified - complete login
+            user_is_super_admin = is_super_admin(pending_email)
+            user_is_admin = user_is_super_admin or is_admin(pending_email)
             st.session_state.user_email = pending_email
-            st.session_state.is_admin = is_admin(pending_email)
-            st.session_state.is_super_admin = is_super_admin(pending_email)
+            st.session_state.is_admin = user_is_admin
+            st.session_state.is_super_admin = user_is_super_admin
             st.session_state.needs_verification = False
             
-            if is_super_admin(pending_email):
+            if user_is_super_admin:
                 st.success(f"✅ Welcome, Super Admin {pending_email}!")
-            elif is_admin(pending_email):
+            elif user_is_admin:
                 st.success(f"✅ Welcome, Admin {pending_email}!")
             else:
                 st.success(f"✅ Welcome, {pending_email}!")
@@ -197,28 +249,29 @@ def authenticate_user() -> Optional[str]:
 
 def logout():
     """Logout current user"""
-    if 'user_email' in st.session_state:
-        del st.session_state.user_email
-    if 'is_admin' in st.session_state:
-        del st.session_state.is_admin
+    # Clear every login key, so no role flag or pending verification outlives the session
+    for key in ('user_email', 'is_admin', 'is_super_admin', 'pending_email', 'needs_verification'):
+        st.session_state.pop(key, None)
     st.rerun()
 
 
 def render_user_info():
     """Render user info in sidebar"""
-    if 'user_email' not in st.session_state:
+    session = st.session_state
+    user_email = session.get('user_email')
+    if user_email is None:
         return
     
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 👤 User Info")
     
     # Show email
-    st.sidebar.markdown(f"**Email:** {st.session_state.user_email}")
+    st.sidebar.markdown(f"**Email:** {user_email}")
     
     # Show role
-    if st.session_state.get('is_super_admin', False):
+    if session.get('is_super_admin', False):
         st.sidebar.markdown("**Role:** ⭐ Super Admin")
-    elif st.session_state.get('is_admin', False):
+    elif session.get('is_admin', False):
         st.sidebar.markdown("**Role:** 🔧 Admin")
     else:
         st.sidebar.markdown("**Role:** 👁️ Viewer")
@@ -262,15 +315,17 @@ def require_admin():
 
 def render_admin_panel():
     """Render admin panel in sidebar"""
-    if not st.session_state.get('is_admin', False):
+    session = st.session_state
+    if not session.get('is_admin', False):
         return
     
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 🔧 Admin Panel")
     
     # Data refresh info
-    if 'last_data_refresh' in st.session_state:
-        st.sidebar.markdown(f"**Last Refresh:** {st.session_state.last_data_refresh}")
+    last_refresh = session.get('last_data_refresh')
+    if last_refresh is not None:
+        st.sidebar.markdown(f"**Last Refresh:** {last_refresh}")
     else:
         st.sidebar.markdown("**Last Refresh:** Never")
     
@@ -279,7 +334,8 @@ def render_admin_panel():
 
 def show_admin_badge():
     """Show admin badge in main area"""
-    if st.session_state.get('is_super_admin', False):
+    session = st.session_state
+    if session.get('is_super_admin', False):
         st.markdown(
             """
             <div style="background: linear-gradient(90deg, #FFD700 0%, #FFA500 100%); 
@@ -290,7 +346,7 @@ def show_admin_badge():
             """,
             unsafe_allow_html=True
         )
-    elif st.session_state.get('is_admin', False):
+    elif session.get('is_admin', False):
         st.markdown(
             """
             <div style="background: linear-gradient(90deg, #3874F2 0%, #1abc9c 100%); 
@@ -363,6 +419,5 @@ def remove_admin(email: str) -> Tuple[bool, str]:
 def get_admin_list() -> list:
     """Get list of all admin emails (regular + super)"""
     dynamic_admins = _load_admin_list_from_file()
-    all_admins = list(set(dynamic_admins + SUPER_ADMIN_EMAILS))
-    return sorted(all_admins)
+    return sorted(_SUPER_ADMIN_SET | set(map(str.lower, dynamic_admins)))
 
@@ -3,8 +3,31 @@ Column Alias/Fuzzy Matching Utilities
 Handles different column name variations across Excel files
 """
 
+import os
+from types import MappingProxyType
+
+import numpy as np
 import pandas as pd
 
+# Print debug output from the shared helpers (off by default; set CONFIG_OPS_DEBUG=1 to enable)
+DEBUG = os.getenv('CONFIG_OPS_DEBUG') == '1'
+
+# Arrow-backed strings: .str operations run as Arrow compute kernels instead of
+# per-cell Python str calls. Falls back to pandas' default string storage without pyarrow.
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    STRING_DTYPE = pd.StringDtype()
+
+# Dashes and underscores both become spaces - one translate pass instead of two replace calls
+_NAME_TRANS = str.maketrans('-_', '  ')
+
+
+def _normalize_name(name):
+    """Normalize a column name: trimmed, lowercase, dashes/underscores as spaces"""
+    return name.strip().lower().translate(_NAME_TRANS)
+
 
 def standardize_columns(df):
     """
@@ -16,9 +39,10 @@ def standardize_columns(df):
     Returns:
         pandas DataFrame with standardized column names
     """
-    df = df.copy()
+    # Shallow copy: only the labels change, so the data buffers are shared with the input
+    df = df.copy(deep=False)
     # Make all column names lower-case, remove extra spaces, normalize dashes/underscores
-    df.columns = [col.strip().lower().replace('-', ' ').replace('_', ' ') for col in df.columns]
+    df.columns = df.columns.str.strip().str.lower().str.translate(_NAME_TRANS)
     return df
 
 
@@ -50,38 +74,117 @@ COLUMN_ALIASES = {
     'vendor list updated': ['vendor list updated', 'vendor updated', 'vendor list'],
 }
 
+# Aliases as lookup keys, normalized once instead of on every lookup/rename - read-only
+# (kept per standard name - several standard names share aliases, so a flat alias map would be ambiguous)
+_ALIAS_KEYS = MappingProxyType({
+    standard_name: tuple(alias.strip().lower() for alias in aliases)
+    for standard_name, aliases in COLUMN_ALIASES.items()
+})
+
+# Standard names that are not an alias of another standard name: a frame whose
+# columns are all in here is already standard and rename_columns_to_standard has nothing to do
+_STABLE_STANDARD_NAMES = frozenset(
+    standard_name for standard_name in _ALIAS_KEYS
+    if not any(
+        standard_name in alias_keys
+        for other_name, alias_keys in _ALIAS_KEYS.items() if other_name != standard_name
+    )
+)
+
+
+# --- REGION NAMES (lowercase -> canonical display name) ---
+REGION_CANONICAL = {
+    'usa east': 'USA East',
+    'usa west': 'USA West',
+    'usa west and central': 'USA West and Central',
+    'mid market': 'Mid Market',
+    'enterprise': 'Enterprise',
+    'canada': 'Canada',
+    'nam': 'NAM',
+    'emea': 'EMEA',
+    'apac': 'APAC',
+    'latam': 'LATAM',
+}
 
-def find_column(df, expected):
+
+def normalize_regions(regions):
     """
-    Find a column in DataFrame using fuzzy matching with aliases
-    Assumes df columns are already standardized (lowercase, no dashes/underscores)
+    Normalize region values to their canonical display names
+    String work runs on the distinct values only (a handful), not on every row;
+    unknown regions fall back to title case
+
+    Args:
+        regions: pandas Series of region values
+
+    Returns:
+        pandas Series (categorical) of canonical region names (missing values stay missing)
+    """
+    # Row -> distinct raw value codes (missing values get -1)
+    codes, uniques = pd.factorize(regions)
+
+    names = pd.Series(uniques).astype(STRING_DTYPE).str.strip()
+    canonical = names.str.lower().map(REGION_CANONICAL).fillna(names.str.title())
+
+    # Spellings like "usa east" and "USA East " collapse onto one category
+    # (the appended -1 keeps missing rows missing: code -1 indexes the last element)
+    canonical_codes, categories = pd.factorize(canonical)
+    row_codes = np.append(canonical_codes, -1)[codes]
+
+    return pd.Series(
+        pd.Categorical.from_codes(row_codes, categories=categories),
+        index=regions.index,
+        name=regions.name
+    )
+
+
+def _find_column_or_none(df, expected):
+    """
+    Find a column in DataFrame using aliases, without raising on a miss
 
     Args:
         df: pandas DataFrame (should be standardized first)
         expected: Expected column name (will be normalized)
 
     Returns:
-        str: Actual column name in the DataFrame
-
-    Raises:
-        KeyError: If column not found
+        tuple: (actual column name or None, aliases tried)
     """
     # Normalize the expected column name
-    expected_normalized = expected.strip().lower().replace('-', ' ').replace('_', ' ')
+    expected_normalized = _normalize_name(expected)
 
     # Get aliases for this column
-    aliases = COLUMN_ALIASES.get(expected_normalized, [expected_normalized])
+    aliases = _ALIAS_KEYS.get(expected_normalized, (expected_normalized,))
 
     # Try to find a match
     for alias in aliases:
         if alias in df.columns:
-            return alias
+            return alias, aliases
+
+    return None, aliases
 
-    raise KeyError(
-        f"Column '{expected}' not found in your file. "
-        f"Tried: {aliases}. "
-        f"Got columns: {list(df.columns)}"
-    )
+
+def find_column(df, expected):
+    """
+    Find a column in DataFrame using fuzzy matching with aliases
+    Assumes df columns are already standardized (lowercase, no dashes/underscores)
+
+    Args:
+        df: pandas DataFrame (should be standardized first)
+        expected: Expected column name (will be normalized)
+
+    Returns:
+        str: Actual column name in the DataFrame
+
+    Raises:
+        KeyError: If column not found
+    """
+    col_name, aliases = _find_column_or_none(df, expected)
+    if col_name is None:
+        raise KeyError(
+            f"Column '{expected}' not found in your file. "
+            f"Tried: {list(aliases)}. "
+            f"Got columns: {list(df.columns)}"
+        )
+    return col_name
 
 
 def safe_get_column(df, expected, default=None):
@@ -96,11 +199,8 @@ def safe_get_column(df, expected, default=None):
     Returns:
         pandas Series or default value
     """
-    try:
-        col_name = find_column(df, expected)
-        return df[col_name]
-    except KeyError:
-        return default
+    col_name, _ = _find_column_or_none(df, expected)
+    return df[col_name] if col_name is not None else default
 
 
 def has_column(df, expected):
@@ -114,11 +214,7 @@ def has_column(df, expected):
     Returns:
         bool: True if column exists, False otherwise
     """
-    try:
-        find_column(df, expected)
-        return True
-    except KeyError:
-        return False
+    return _find_column_or_none(df, expected)[0] is not None
 
 
 def rename_columns_to_standard(df):
@@ -131,16 +227,19 @@ def rename_columns_to_standard(df):
     Returns:
         pandas DataFrame with standardized column names
     """
-    df = df.copy()
+    df = df.copy(deep=False)  # Labels only - the input frame is never modified
     df.columns = df.columns.str.strip()
     
+    # Fast path: files from the standard template need no alias walk
+    if all(col in _STABLE_STANDARD_NAMES for col in df.columns):
+        return df
+    
     # Create reverse mapping: actual column -> standard name
     rename_map = {}
     df_cols_lower = {c.lower().strip(): c for c in df.columns}
     
-    for standard_name, aliases in COLUMN_ALIASES.items():
-        for alias in aliases:
-            key = alias.strip().lower()
+    for standard_name, alias_keys in _ALIAS_KEYS.items():
+        for key in alias_keys:
             if key in df_cols_lower:
                 actual_col = df_cols_lower[key]
                 if actual_col != standard_name:  # Only rename if different
@@ -149,7 +248,8 @@ def rename_columns_to_standard(df):
     
     if rename_map:
         df.rename(columns=rename_map, inplace=True)
-        print(f"[DEBUG] Renamed columns: {rename_map}")
+        if DEBUG:
+            print(f"[DEBUG] Renamed columns: {rename_map}")
 
     return df
 
@@ -190,9 +290,10 @@ def validate_and_debug_dataframe(df, dashboard_name="Dashboard"):
     if date_cols:
         date_col = date_cols[0]
         print(f"\n✅ Go Live Date column found: '{date_col}'")
-        print(f"   Earliest date: {pd.to_datetime(df[date_col], errors='coerce').min()}")
-        print(f"   Latest date: {pd.to_datetime(df[date_col], errors='coerce').max()}")
-        print(f"   Null dates: {pd.to_datetime(df[date_col], errors='coerce').isna().sum()}")
+        go_live_dates = pd.to_datetime(df[date_col], errors='coerce')  # Parse once for all three stats
+        print(f"   Earliest date: {go_live_dates.min()}")
+        print(f"   Latest date: {go_live_dates.max()}")
+        print(f"   Null dates: {go_live_dates.isna().sum()}")
     else:
         print(f"\n⚠️  Go Live Date column not found")
 
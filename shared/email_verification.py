@@ -4,12 +4,9 @@ Sends verification codes to email addresses to ensure they are valid
 """
 
 import streamlit as st
-import smtplib
-import random
-import string
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from datetime import datetime, timedelta
+import secrets
+import hmac
+import time
 from typing import Optional, Tuple
 
 # ============================================================================
@@ -47,11 +44,12 @@ CODE_EXPIRY_MINUTES = 10
 def generate_verification_code() -> str:
     """
     Generate a random 6-digit verification code
+    Drawn as one integer from the OS CSPRNG and zero-padded
     
     Returns:
         str: 6-digit verification code
     """
-    return ''.join(random.choices(string.digits, k=CODE_LENGTH))
+    return f"{secrets.randbelow(10 ** CODE_LENGTH):0{CODE_LENGTH}d}"
 
 
 def store_verification_code(email: str, code: str):
@@ -65,9 +63,16 @@ def store_verification_code(email: str, code: str):
     if 'verification_codes' not in st.session_state:
         st.session_state.verification_codes = {}
     
-    st.session_state.verification_codes[email.lower()] = {
+    codes = st.session_state.verification_codes
+    now = time.monotonic()
+    
+    # Drop codes that expired without being verified, so the dict only holds pending codes
+    for expired_email in [e for e, data in codes.items() if data['expiry'] < now]:
+        del codes[expired_email]
+    
+    codes[email.lower()] = {
         'code': code,
-        'expiry': datetime.now() + timedelta(minutes=CODE_EXPIRY_MINUTES),
+        'expiry': now + CODE_EXPIRY_MINUTES * 60,  # time.monotonic() seconds
         'attempts': 0
     }
 
@@ -94,7 +99,7 @@ def verify_code(email: str, entered_code: str) -> Tuple[bool, str]:
     code_data = st.session_state.verification_codes[email_lower]
     
     # Check expiry
-    if datetime.now() > code_data['expiry']:
+    if time.monotonic() > code_data['expiry']:
         del st.session_state.verification_codes[email_lower]
         return False, "Verification code has expired. Please request a new code."
     
@@ -103,8 +108,8 @@ def verify_code(email: str, entered_code: str) -> Tuple[bool, str]:
         del st.session_state.verification_codes[email_lower]
         return False, "Too many failed attempts. Please request a new code."
     
-    # Verify code
-    if entered_code == code_data['code']:
+    # Verify code (constant-time compare; bytes so non-ASCII input can't raise)
+    if hmac.compare_digest(entered_code.encode(), code_data['code'].encode()):
         # Code is valid - clean up
         del st.session_state.verification_codes[email_lower]
         return True, "Email verified successfully!"
@@ -130,6 +135,12 @@ def send_verification_email(email: str, code: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
+    # Imported on first send: auth imports this module on every page, but
+    # verification emails are rare (and disabled by default)
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+
     try:
         # Create message
         msg = MIMEMultipart('alternative')
@@ -269,7 +280,13 @@ def render_email_verification_ui(email: str) -> bool:
             resend_button = st.form_submit_button("🔄 Resend Code", use_container_width=True)
         
         if verify_button:
-            if entered_code:
+            entered_code = entered_code.strip()
+            if not entered_code:
+                st.warning("Please enter the verification code")
+            elif not (entered_code.isascii() and entered_code.isdigit() and len(entered_code) == CODE_LENGTH):
+                # Malformed input never reaches verify_code, so typos don't use up an attempt
+                st.error(f"❌ The verification code must be {CODE_LENGTH} digits")
+            else:
                 is_valid, message = verify_code(email, entered_code)
                 
                 if is_valid:
@@ -278,8 +295,6 @@ def render_email_verification_ui(email: str) -> bool:
                     return True
                 else:
                     st.error(f"❌ {message}")
-            else:
-                st.warning("Please enter the verification code")
         
         if resend_button:
             # Generate new code
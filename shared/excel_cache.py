@@ -0,0 +1,84 @@
+"""
+Parquet Sidecar Cache for Excel Data Sources
+Stores the parsed workbook next to the Excel file so unchanged files skip XLSX parsing
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+
+def get_parquet_cache_path(excel_path: Path, version: int) -> Path:
+    """
+    Get the parquet sidecar path for an Excel file
+
+    The sidecar name embeds the loader's cache version and the Excel file's
+    modification time (in nanoseconds) and size, so editing the workbook - even
+    twice within the same second - or changing how the loader parses it
+    automatically points to a new (not yet written) cache file.
+
+    Args:
+        excel_path: Path to the Excel file
+        version: Cache version of the loader that parses the file
+
+    Returns:
+        Path: Path to the parquet sidecar (e.g. "CRM Data.v1.1759854399123456789-48213.parquet")
+    """
+    stat = excel_path.stat()
+    return excel_path.with_suffix(f'.v{version}.{stat.st_mtime_ns}-{stat.st_size}.parquet')
+
+
+def read_parquet_cache(excel_path: Path, version: int) -> Optional[pd.DataFrame]:
+    """
+    Read the parquet sidecar for an Excel file if it is up to date
+
+    Args:
+        excel_path: Path to the Excel file
+        version: Cache version of the loader that parses the file
+
+    Returns:
+        pd.DataFrame if a fresh sidecar exists and is readable, None otherwise
+    """
+    cache_path = get_parquet_cache_path(excel_path, version)
+
+    if not cache_path.exists():
+        return None
+
+    try:
+        df = pd.read_parquet(cache_path)
+        print(f"[INFO Excel Cache] Loaded cached data: {cache_path.name}")
+        return df
+    except Exception as e:
+        print(f"[WARNING Excel Cache] Could not read {cache_path.name}: {e}")
+        return None
+
+
+def write_parquet_cache(excel_path: Path, df: pd.DataFrame, version: int) -> None:
+    """
+    Write the parquet sidecar for an Excel file and remove stale sidecars
+
+    Failures (read-only folder, missing pyarrow) are logged and ignored -
+    the cache is an optimization, never a requirement.
+
+    Args:
+        excel_path: Path to the Excel file
+        df: Parsed data to cache
+        version: Cache version of the loader that parses the file
+    """
+    cache_path = get_parquet_cache_path(excel_path, version)
+
+    try:
+        df.to_parquet(cache_path, compression='zstd', index=False)
+        print(f"[INFO Excel Cache] Wrote cache: {cache_path.name}")
+    except Exception as e:
+        print(f"[WARNING Excel Cache] Could not write {cache_path.name}: {e}")
+        return
+
+    # Remove sidecars left over from older versions of the Excel file or the loader
+    for stale_path in excel_path.parent.glob(f'{excel_path.stem}.*.parquet'):
+        if stale_path != cache_path:
+            try:
+                stale_path.unlink()
+            except OSError:
+                pass
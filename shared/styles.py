@@ -3,298 +3,328 @@ Shared Styles for Config Operations Hub
 Sleek Black Theme - Modern, professional design with perfect alignment
 """
 
+import re
+from datetime import datetime
+
 import streamlit as st
 
 
+def _minify_css(css: str) -> str:
+    """
+    Minify a stylesheet: drop comments and collapse whitespace
+
+    Args:
+        css: Stylesheet source
+
+    Returns:
+        str: Equivalent stylesheet on a single line
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{}:;,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+# Sleek Black Theme stylesheet (readable source - minified below, since it is sent on every rerun)
+_MODERN_CSS_SOURCE = """
+<style>
+    /* Base Styles */
+    .stApp {
+        background: #18191A !important;
+        color: #F5F5F7 !important;
+    }
+    .block-container, .css-18e3th9, .element-container {
+        background: #18191A !important;
+        border-radius: 12px;
+    }
+    h1, h2, h3, h4, h5, h6, .st-bq, .st-bv, .st-e0, .st-eb {
+        color: #F5F5F7 !important;
+    }
+    p, span, div, label {
+        color: #F5F5F7 !important;
+    }
+    
+    /* Card/Button Rows - one shared CSS Grid for Perfect Alignment;
+       each row only sets its column width and gap */
+    .kpi-row, .button-row, .region-row, .impl-type-row {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(var(--row-min, 180px), 1fr));
+        gap: var(--row-gap, 16px);
+        margin: 1.5em 0;
+        max-width: 100%;
+    }
+    
+    /* KPI Cards Row */
+    .kpi-card {
+        border-radius: 12px;
+        padding: 24px 16px;
+        min-height: 120px;
+        font-size: 2em;
+        font-weight: 700;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        color: #fff;
+        text-align: center;
+        flex-direction: column;
+        box-shadow: 0 2px 8px 0 rgba(0,0,0,0.19);
+        cursor: pointer;
+        transition: transform 0.2s, box-shadow 0.2s;
+        will-change: transform;  /* Own compositor layer up front - no repaint on first hover */
+        position: relative;
+        box-sizing: border-box;
+    }
+    .kpi-card:hover {
+        transform: translateY(-4px);
+        box-shadow: 0 4px 12px rgba(0,0,0,0.3);
+    }
+    .kpi-card.selected {
+        outline: 3px solid #FFD700;
+        outline-offset: 0;
+    }
+    
+    /* Cards lay out and paint independently, so a selection change doesn't dirty their siblings */
+    .kpi-card, .region-btn, .impl-type-btn, .kpi-button {
+        contain: layout paint;
+    }
+    
+    /* KPI Color Classes */
+    .kpi-success { background: #29C46F; }
+    .kpi-warning { background: #FF9800; }
+    .kpi-error { background: #F44336; }
+    .kpi-accent { background: #3874F2; }
+    .kpi-info { background: #17a2b8; }
+    .kpi-primary { background: #008080; }
+    .kpi-grey { background: #23272F; color: #B0B8C8; }
+    
+    /* Button Row - Matches KPI Grid Exactly */
+    .button-row {
+        margin: 0 0 2em 0;
+    }
+    .kpi-button {
+        background: transparent;
+        color: #F5F5F7;
+        border: none;
+        border-radius: 8px;
+        padding: 12px 16px;
+        font-weight: 600;
+        font-size: 0.95em;
+        cursor: pointer;
+        transition: background-color 0.2s, color 0.2s;
+        text-align: center;
+        box-sizing: border-box;
+        white-space: nowrap;
+        overflow: hidden;
+        text-overflow: ellipsis;
+    }
+    .kpi-button:hover {
+        background: #2b2f38;
+        color: #3874F2;
+    }
+    
+    /* Region Cards/Buttons - Grid Layout */
+    .region-row {
+        --row-min: 160px;
+        --row-gap: 12px;
+    }
+    .region-btn {
+        background: #23272F;
+        color: #fff !important;
+        border-radius: 9px;
+        padding: 18px 16px;
+        font-weight: 600;
+        font-size: 1.05em;
+        border: 2px solid #2b2b30;
+        transition: background-color 0.2s, border-color 0.2s, color 0.2s;
+        cursor: pointer;
+        text-align: center;
+        box-sizing: border-box;
+        white-space: nowrap;
+        overflow: hidden;
+        text-overflow: ellipsis;
+    }
+    .region-btn:hover {
+        background: #2b2f38;
+        border-color: #3874F2;
+    }
+    .region-btn.selected {
+        background: #3874F2;
+        color: #fff !important;
+        border-color: #3874F2;
+        outline: 2px solid rgba(56, 116, 242, 0.3);
+        outline-offset: 0;
+    }
+    
+    /* Implementation Type Pills - Grid Layout */
+    .impl-type-row {
+        --row-min: 140px;
+        --row-gap: 12px;
+    }
+    .impl-type-btn {
+        background: #23272F;
+        color: #fff !important;
+        border-radius: 9px;
+        padding: 16px 12px;
+        font-weight: 600;
+        font-size: 1em;
+        border: 2px solid #2b2b30;
+        transition: background-color 0.2s, border-color 0.2s, color 0.2s;
+        cursor: pointer;
+        text-align: center;
+        box-sizing: border-box;
+    }
+    .impl-type-btn:hover {
+        background: #2b2f38;
+        border-color: #3874F2;
+    }
+    .impl-type-btn.selected {
+        background: #3874F2;
+        color: #fff !important;
+        border-color: #3874F2;
+        outline: 2px solid rgba(56, 116, 242, 0.3);
+        outline-offset: 0;
+    }
+    
+    /* Alert Banner */
+    .alert {
+        background: #FFD600;
+        color: #18191A;
+        border-radius: 8px;
+        padding: 18px 24px;
+        margin-bottom: 18px;
+        font-weight: 700;
+        font-size: 1.1em;
+    }
+    
+    /* Download Button */
+    .stDownloadButton > button {
+        background: #3874f2;
+        color: #fff;
+        border-radius: 9px;
+        font-weight: 600;
+        border: none;
+        transition: background-color 0.2s, transform 0.2s, box-shadow 0.2s;
+        will-change: transform;
+    }
+    .stDownloadButton > button:hover {
+        background: #2d5fd1;
+        transform: translateY(-2px);
+        box-shadow: 0 4px 8px rgba(56, 116, 242, 0.3);
+    }
+    
+    /* Radio Buttons */
+    .stRadio > div {
+        flex-direction: row;
+        gap: 12px;
+    }
+    .stRadio > div > label {
+        background: #23272F;
+        color: #F5F5F7 !important;
+        padding: 10px 18px;
+        border-radius: 8px;
+        border: 2px solid #2b2b30;
+        cursor: pointer;
+        transition: background-color 0.2s, border-color 0.2s;
+    }
+    .stRadio > div > label:hover {
+        border-color: #3874f2;
+        background: #2b2f38;
+    }
+    
+    /* Selectbox */
+    .stSelectbox > div > div {
+        background: #23272F;
+        color: #F5F5F7;
+        border: 2px solid #2b2b30;
+        border-radius: 8px;
+    }
+    
+    /* Tables */
+    .dataframe {
+        border-radius: 8px;
+        overflow: hidden;
+        background: #23272F !important;
+        color: #F5F5F7 !important;
+    }
+    .dataframe th {
+        background: #2b2f38 !important;
+        color: #F5F5F7 !important;
+        font-weight: 600;
+    }
+    .dataframe td {
+        background: #23272F !important;
+        color: #F5F5F7 !important;
+    }
+    
+    /* Info/Warning boxes */
+    .stInfo, .stWarning, .stSuccess, .stError {
+        border-radius: 8px;
+        padding: 16px;
+        background: #23272F !important;
+        color: #F5F5F7 !important;
+    }
+    
+    /* Tabs */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+        background: #18191A;
+    }
+    .stTabs [data-baseweb="tab"] {
+        background: #23272F;
+        color: #F5F5F7;
+        border-radius: 8px 8px 0 0;
+        padding: 10px 20px;
+        border: 2px solid #2b2b30;
+    }
+    .stTabs [aria-selected="true"] {
+        background: #3874F2;
+        color: #fff;
+        border-color: #3874F2;
+    }
+    
+    /* Buttons - Visible and styled */
+    .stButton > button {
+        background: #23272F;
+        color: #F5F5F7;
+        border: 2px solid #2b2b30;
+        border-radius: 8px;
+        padding: 10px 16px;
+        font-weight: 600;
+        transition: background-color 0.2s, border-color 0.2s, color 0.2s, transform 0.2s, box-shadow 0.2s;
+        will-change: transform;
+        width: 100%;
+        box-sizing: border-box;
+        cursor: pointer;
+        font-size: 0.9em;
+    }
+    .stButton > button:hover {
+        background: #3874F2;
+        border-color: #3874F2;
+        color: #fff;
+        transform: translateY(-2px);
+    }
+    
+    /* Dividers */
+    hr {
+        border-color: #2b2b30 !important;
+    }
+    
+    /* Hide Streamlit button focus outline */
+    .stButton > button:focus {
+        outline: none;
+        box-shadow: 0 0 0 2px rgba(56, 116, 242, 0.3);
+    }
+</style>
+"""
+
+_MODERN_CSS = _minify_css(_MODERN_CSS_SOURCE)
+
+
 def apply_modern_styles():
     """Apply modern CSS styling to the dashboard - Sleek Black Theme with Perfect Alignment"""
-    
-    st.markdown("""
-        <style>
-            /* Base Styles */
-            .stApp {
-                background: #18191A !important;
-                color: #F5F5F7 !important;
-            }
-            .block-container, .css-18e3th9, .element-container {
-                background: #18191A !important;
-                border-radius: 12px;
-            }
-            h1, h2, h3, h4, h5, h6, .st-bq, .st-bv, .st-e0, .st-eb {
-                color: #F5F5F7 !important;
-            }
-            p, span, div, label {
-                color: #F5F5F7 !important;
-            }
-            
-            /* KPI Cards Row - CSS Grid for Perfect Alignment */
-            .kpi-row {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-                gap: 16px;
-                margin: 1.5em 0;
-                max-width: 100%;
-            }
-            .kpi-card {
-                border-radius: 12px;
-                padding: 24px 16px;
-                min-height: 120px;
-                font-size: 2em;
-                font-weight: 700;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                color: #fff;
-                text-align: center;
-                flex-direction: column;
-                box-shadow: 0 2px 8px 0 rgba(0,0,0,0.19);
-                cursor: pointer;
-                transition: transform 0.2s, box-shadow 0.2s;
-                position: relative;
-                box-sizing: border-box;
-            }
-            .kpi-card:hover {
-                transform: translateY(-4px);
-                box-shadow: 0 4px 12px rgba(0,0,0,0.3);
-            }
-            .kpi-card.selected {
-                box-shadow: 0 0 0 3px #FFD700, 0 4px 12px rgba(255, 215, 0, 0.4);
-            }
-            
-            /* KPI Color Classes */
-            .kpi-success { background: #29C46F; }
-            .kpi-warning { background: #FF9800; }
-            .kpi-error { background: #F44336; }
-            .kpi-accent { background: #3874F2; }
-            .kpi-info { background: #17a2b8; }
-            .kpi-primary { background: #008080; }
-            .kpi-grey { background: #23272F; color: #B0B8C8; }
-            
-            /* Button Row - Matches KPI Grid Exactly */
-            .button-row {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-                gap: 16px;
-                margin: 0 0 2em 0;
-                max-width: 100%;
-            }
-            .kpi-button {
-                background: transparent;
-                color: #F5F5F7;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 16px;
-                font-weight: 600;
-                font-size: 0.95em;
-                cursor: pointer;
-                transition: all 0.2s;
-                text-align: center;
-                box-sizing: border-box;
-                white-space: nowrap;
-                overflow: hidden;
-                text-overflow: ellipsis;
-            }
-            .kpi-button:hover {
-                background: #2b2f38;
-                color: #3874F2;
-            }
-            
-            /* Region Cards/Buttons - Grid Layout */
-            .region-row {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
-                gap: 12px;
-                margin: 1.5em 0;
-                max-width: 100%;
-            }
-            .region-btn {
-                background: #23272F;
-                color: #fff !important;
-                border-radius: 9px;
-                padding: 18px 16px;
-                font-weight: 600;
-                font-size: 1.05em;
-                border: 2px solid #2b2b30;
-                transition: all 0.2s;
-                cursor: pointer;
-                text-align: center;
-                box-sizing: border-box;
-                white-space: nowrap;
-                overflow: hidden;
-                text-overflow: ellipsis;
-            }
-            .region-btn:hover {
-                background: #2b2f38;
-                border-color: #3874F2;
-            }
-            .region-btn.selected {
-                background: #3874F2;
-                color: #fff !important;
-                border-color: #3874F2;
-                box-shadow: 0 0 0 2px rgba(56, 116, 242, 0.3);
-            }
-            
-            /* Implementation Type Pills - Grid Layout */
-            .impl-type-row {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
-                gap: 12px;
-                margin: 1.5em 0;
-                max-width: 100%;
-            }
-            .impl-type-btn {
-                background: #23272F;
-                color: #fff !important;
-                border-radius: 9px;
-                padding: 16px 12px;
-                font-weight: 600;
-                font-size: 1em;
-                border: 2px solid #2b2b30;
-                transition: all 0.2s;
-                cursor: pointer;
-                text-align: center;
-                box-sizing: border-box;
-            }
-            .impl-type-btn:hover {
-                background: #2b2f38;
-                border-color: #3874F2;
-            }
-            .impl-type-btn.selected {
-                background: #3874F2;
-                color: #fff !important;
-                border-color: #3874F2;
-                box-shadow: 0 0 0 2px rgba(56, 116, 242, 0.3);
-            }
-            
-            /* Alert Banner */
-            .alert {
-                background: #FFD600;
-                color: #18191A;
-                border-radius: 8px;
-                padding: 18px 24px;
-                margin-bottom: 18px;
-                font-weight: 700;
-                font-size: 1.1em;
-            }
-            
-            /* Download Button */
-            .stDownloadButton > button {
-                background: #3874f2;
-                color: #fff;
-                border-radius: 9px;
-                font-weight: 600;
-                border: none;
-                transition: all 0.2s;
-            }
-            .stDownloadButton > button:hover {
-                background: #2d5fd1;
-                transform: translateY(-2px);
-                box-shadow: 0 4px 8px rgba(56, 116, 242, 0.3);
-            }
-            
-            /* Radio Buttons */
-            .stRadio > div {
-                flex-direction: row;
-                gap: 12px;
-            }
-            .stRadio > div > label {
-                background: #23272F;
-                color: #F5F5F7 !important;
-                padding: 10px 18px;
-                border-radius: 8px;
-                border: 2px solid #2b2b30;
-                cursor: pointer;
-                transition: all 0.2s;
-            }
-            .stRadio > div > label:hover {
-                border-color: #3874f2;
-                background: #2b2f38;
-            }
-            
-            /* Selectbox */
-            .stSelectbox > div > div {
-                background: #23272F;
-                color: #F5F5F7;
-                border: 2px solid #2b2b30;
-                border-radius: 8px;
-            }
-            
-            /* Tables */
-            .dataframe {
-                border-radius: 8px;
-                overflow: hidden;
-                background: #23272F !important;
-                color: #F5F5F7 !important;
-            }
-            .dataframe th {
-                background: #2b2f38 !important;
-                color: #F5F5F7 !important;
-                font-weight: 600;
-            }
-            .dataframe td {
-                background: #23272F !important;
-                color: #F5F5F7 !important;
-            }
-            
-            /* Info/Warning boxes */
-            .stInfo, .stWarning, .stSuccess, .stError {
-                border-radius: 8px;
-                padding: 16px;
-                background: #23272F !important;
-                color: #F5F5F7 !important;
-            }
-            
-            /* Tabs */
-            .stTabs [data-baseweb="tab-list"] {
-                gap: 8px;
-                background: #18191A;
-            }
-            .stTabs [data-baseweb="tab"] {
-                background: #23272F;
-                color: #F5F5F7;
-                border-radius: 8px 8px 0 0;
-                padding: 10px 20px;
-                border: 2px solid #2b2b30;
-            }
-            .stTabs [aria-selected="true"] {
-                background: #3874F2;
-                color: #fff;
-                border-color: #3874F2;
-            }
-            
-            /* Buttons - Visible and styled */
-            .stButton > button {
-                background: #23272F;
-                color: #F5F5F7;
-                border: 2px solid #2b2b30;
-                border-radius: 8px;
-                padding: 10px 16px;
-                font-weight: 600;
-                transition: all 0.2s;
-                width: 100%;
-                box-sizing: border-box;
-                cursor: pointer;
-                font-size: 0.9em;
-            }
-            .stButton > button:hover {
-                background: #3874F2;
-                border-color: #3874F2;
-                color: #fff;
-                transform: translateY(-2px);
-            }
-            
-            /* Dividers */
-            hr {
-                border-color: #2b2b30 !important;
-            }
-            
-            /* Hide Streamlit button focus outline */
-            .stButton > button:focus {
-                outline: none;
-                box-shadow: 0 0 0 2px rgba(56, 116, 242, 0.3);
-            }
-        </style>
-    """, unsafe_allow_html=True)
+    # Emitted on every rerun: Streamlit drops elements a rerun doesn't re-create,
+    # so skipping this call would remove the styles from the page
+    st.markdown(_MODERN_CSS, unsafe_allow_html=True)
 
 
 def render_modern_header(title: str, icon_url: str = "https://img.icons8.com/?size=512&id=w12qCfGNQTGx&format=png"):
@@ -305,8 +335,6 @@ def render_modern_header(title: str, icon_url: str = "https://img.icons8.com/?si
         title: Dashboard title
         icon_url: URL to icon image
     """
-    from datetime import datetime
-    
     # Get current timestamp
     current_time = datetime.now().strftime("%d-%b-%Y %I:%M:%S %p")
     
@@ -2,6 +2,7 @@
 Quick test script to verify the dashboard setup
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -9,28 +10,14 @@ print("=" * 60)
 print("ARC Dashboard Setup Test")
 print("=" * 60)
 
-# Test imports
-print("\n1. Testing imports...")
-try:
-    import streamlit as st
-    print("   ✓ Streamlit imported successfully")
-except ImportError as e:
-    print(f"   ✗ Streamlit import failed: {e}")
-    sys.exit(1)
-
-try:
-    import pandas as pd
-    print("   ✓ Pandas imported successfully")
-except ImportError as e:
-    print(f"   ✗ Pandas import failed: {e}")
-    sys.exit(1)
-
-try:
-    import plotly
-    print("   ✓ Plotly imported successfully")
-except ImportError as e:
-    print(f"   ✗ Plotly import failed: {e}")
-    sys.exit(1)
+# Check packages (presence only - find_spec locates a package without running its
+# import; pandas is imported for real by the mock data step below)
+print("\n1. Checking installed packages...")
+for module_name, display_name in [("streamlit", "Streamlit"), ("pandas", "Pandas"), ("plotly", "Plotly")]:
+    if importlib.util.find_spec(module_name) is None:
+        print(f"   ✗ {display_name} is not installed (no module named '{module_name}')")
+        sys.exit(1)
+    print(f"   ✓ {display_name} installed")
 
 # Test mock data generation
 print("\n2. Testing mock data generation...")
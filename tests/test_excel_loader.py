@@ -0,0 +1,46 @@
+"""
+Tests for the Regression Excel date parsing
+"""
+
+from datetime import datetime
+
+import pandas as pd
+
+from regression_dashboard.data.excel_loader import _parse_dates
+
+
+def test_parse_dates_datetime_and_number():
+    """Numbers are not dates: they stay NaT next to real datetime cells"""
+    values = pd.Series([datetime(2025, 1, 5), 45678], dtype=object)
+
+    parsed = _parse_dates(values)
+
+    assert parsed.iloc[0] == pd.Timestamp('2025-01-05')
+    assert pd.isna(parsed.iloc[1])
+
+
+def test_parse_dates_mixed_datetime_number_text():
+    """Datetime cells, ISO text and other text layouts all parse; the rest is NaT"""
+    values = pd.Series(
+        [datetime(2025, 1, 5), '2025-02-03', '03/04/2025', 45678, None, 'TBD'],
+        dtype=object
+    )
+
+    parsed = _parse_dates(values)
+
+    assert pd.api.types.is_datetime64_any_dtype(parsed)
+    assert parsed.iloc[:3].tolist() == [
+        pd.Timestamp('2025-01-05'),
+        pd.Timestamp('2025-02-03'),
+        pd.Timestamp('2025-03-04'),
+    ]
+    assert parsed.iloc[3:].isna().all()
+
+
+def test_parse_dates_text_only():
+    """A column of text dates in another layout goes through the fallback"""
+    values = pd.Series(['05-Jan-2025', '2025-01-02'], dtype=object)
+
+    parsed = _parse_dates(values)
+
+    assert parsed.tolist() == [pd.Timestamp('2025-01-05'), pd.Timestamp('2025-01-02')]
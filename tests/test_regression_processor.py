@@ -0,0 +1,42 @@
+"""
+Tests for the Regression SIM window masks
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from regression_dashboard.utils import data_processor
+from regression_dashboard.utils.data_processor import RegressionDataProcessor
+
+
+def _sample_frame(rows: int = 500) -> pd.DataFrame:
+    """SIM Start Dates spread around today, with missing dates and blank statuses"""
+    rng = np.random.default_rng(0)
+    today = pd.Timestamp.now().normalize()
+    sim_start = pd.Series(today + pd.to_timedelta(rng.integers(-20, 20, rows), unit='D'))
+    sim_start[rng.random(rows) < 0.1] = pd.NaT
+
+    return pd.DataFrame({
+        'Go Live Date': sim_start + pd.Timedelta(days=30),
+        'SIM Start Date': sim_start,
+        'Status': rng.choice(np.array(['Completed', 'In Progress', '', ' ', None], dtype=object), rows),
+        'Dealership Name': [f'Dealer {i}' for i in range(rows)],
+        'Assignee': 'QA',
+        'Region': rng.choice(['USA East', 'USA West', 'Canada'], rows),
+    })
+
+
+def test_sim_window_kernel_matches_pandas(monkeypatch):
+    """The Numba kernel builds the same masks as the pandas comparisons"""
+    pytest.importorskip('numba')
+    df = _sample_frame()
+
+    pandas_upcoming, pandas_incomplete = RegressionDataProcessor(df)._sim_window_masks()
+
+    monkeypatch.setattr(data_processor, 'SIM_KERNEL_MIN_ROWS', 0)
+    kernel_upcoming, kernel_incomplete = RegressionDataProcessor(df)._sim_window_masks()
+
+    assert pandas_upcoming.any() and pandas_incomplete.any()
+    np.testing.assert_array_equal(kernel_upcoming, pandas_upcoming)
+    np.testing.assert_array_equal(kernel_incomplete, pandas_incomplete)